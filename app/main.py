@@ -1,12 +1,14 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 from pathlib import Path
 import json
 import os
+from functools import lru_cache
 from utils.data_processor import DataProcessor
-import time
+from utils.charts import chart_points
 from plotly.subplots import make_subplots
 
 # Set page config to wide mode and dark theme
@@ -18,7 +20,7 @@ st.set_page_config(
 )
 
 # Custom CSS for Bloomberg terminal style
-st.markdown("""
+_CSS = """
 <style>
     .stApp {
         background-color: #0D1117;
@@ -119,7 +121,9 @@ st.markdown("""
         color: #C9D1D9;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+st.markdown(_CSS, unsafe_allow_html=True)
 
 # Initialize session state
 if 'initialized' not in st.session_state:
@@ -215,38 +219,41 @@ with st.sidebar:
         ["Dashboard", "Portfolio", "Transaction History", "Monthly Results"]
     )
 
+@lru_cache(maxsize=8192)
 def format_currency(value: float) -> str:
     """Format value as currency"""
     return f"₹{value:,.2f}"
 
+@lru_cache(maxsize=8192)
 def format_percentage(value: float) -> str:
     """Format value as percentage"""
     return f"{value:,.2f}%"
 
+# Display formats applied by the frontend, so numeric columns stay sortable
+_CURRENCY_COLUMN = st.column_config.NumberColumn(format="₹%.2f")
+_PERCENT_COLUMN = st.column_config.NumberColumn(format="%.2f%%")
+
+def _format_news_item(item):
+    """Format a single news item with custom HTML"""
+    link = item.get('link')
+    read_more = f" • <a href='{link}' target='_blank'>Read More</a>" if link else ''
+    
+    return f"""
+    <div class="news-item">
+        <div class="news-header">
+            <span class="news-symbol">{item.get('symbol', '')}</span>
+            <span class="news-type">{item.get('type', '')}</span>
+            <span class="news-time">{item.get('timestamp', '')}</span>
+        </div>
+        <div class="news-title">{item.get('title', '')}</div>
+        <div class="news-summary">{item.get('summary', '')}</div>
+        <div class="news-source">Source: {item.get('source', '')}{read_more}</div>
+    </div>
+    """
+
 def format_news(news_items):
     """Format news items with custom HTML"""
-    html = ""
-    for item in news_items:
-        timestamp = item.get('timestamp', '')
-        symbol = item.get('symbol', '')
-        title = item.get('title', '')
-        summary = item.get('summary', '')
-        source = item.get('source', '')
-        news_type = item.get('type', '')
-        
-        html += f"""
-        <div class="news-item">
-            <div class="news-header">
-                <span class="news-symbol">{symbol}</span>
-                <span class="news-type">{news_type}</span>
-                <span class="news-time">{timestamp}</span>
-            </div>
-            <div class="news-title">{title}</div>
-            <div class="news-summary">{summary}</div>
-            <div class="news-source">Source: {source}</div>
-        </div>
-        """
-    return html
+    return "".join(_format_news_item(item) for item in news_items)
 
 def format_log_entry(log):
     """Format a log entry with custom HTML"""
@@ -265,6 +272,227 @@ def format_log_entry(log):
     </div>
     """
 
+def _state_version() -> str:
+    """Cache key that changes whenever the processor applies a new update"""
+    last_update = st.session_state.processor.get_last_update()
+    return last_update.isoformat() if last_update else ""
+
+@st.cache_data(ttl=2, show_spinner=False)
+def _build_portfolio_df(state_version: str, n_positions: int, _portfolio: dict) -> pd.DataFrame:
+    """Build the holdings table for a given state version"""
+    positions = list(_portfolio.values())
+    n = len(positions)
+    
+    # Compute the numeric columns as arrays and build the frame once
+    qty = np.fromiter((p['quantity'] for p in positions), dtype=np.float64, count=n)
+    avg = np.fromiter((p['avg_price'] for p in positions), dtype=np.float64, count=n)
+    cur = np.fromiter((p['current_price'] for p in positions), dtype=np.float64, count=n)
+    cost = qty * avg
+    current_value = qty * cur
+    pl_amount = current_value - cost
+    
+    df = pd.DataFrame({
+        'Symbol': [p['symbol'] for p in positions],
+        'Quantity': [p['quantity'] for p in positions],
+        'Avg Price': avg,
+        'Current Price': cur,
+        'Current Value': current_value,
+        'P/L Amount': pl_amount,
+        'P/L %': pl_amount / cost * 100
+    })
+    
+    return df
+
+@st.cache_data(ttl=2, show_spinner=False)
+def _build_recent_transactions_df(state_version: str, n_transactions: int, _transactions_df: pd.DataFrame) -> pd.DataFrame:
+    """Build the recent transactions table for a given state version"""
+    df = _transactions_df[['date', 'symbol', 'action', 'quantity', 'price']].copy()
+    df['value'] = df['quantity'] * df['price']
+    
+    # Format the dataframe
+    df.columns = ['Timestamp', 'Symbol', 'Action', 'Quantity', 'Price', 'Value']
+    
+    return df
+
+@st.cache_data(ttl=2, show_spinner=False)
+def _build_transactions_df(
+    state_version: str,
+    n_transactions: int,
+    symbol: str,
+    action: str,
+    date_range: tuple,
+    _transactions_df: pd.DataFrame
+) -> pd.DataFrame:
+    """Filter the transaction history and order it newest first"""
+    df = _transactions_df
+    
+    # Apply filters
+    if symbol != 'All':
+        df = df[df['symbol'] == symbol]
+    if action != 'All':
+        df = df[df['action'] == action]
+    if len(date_range) == 2:
+        df = df[
+            (df['date'].dt.date >= date_range[0]) &
+            (df['date'].dt.date <= date_range[1])
+        ]
+    
+    # Transactions are appended chronologically, so reversing gives newest first
+    return df.iloc[::-1]
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _compute_monthly(n_transactions: int, last_date: str, _transactions_df: pd.DataFrame) -> pd.DataFrame:
+    """Aggregate transactions into monthly returns
+    
+    Transactions are only ever appended, so the count and the latest date
+    identify the frame; price ticks alone don't invalidate the result.
+    """
+    df = _transactions_df.sort_values('date')
+    
+    # Calculate monthly metrics
+    monthly = df.set_index('date').resample('M').agg({
+        'value': 'sum',
+        'profit_loss': 'sum'
+    }).reset_index()
+    
+    monthly['return'] = monthly['profit_loss'] / monthly['value'] * 100
+    monthly['cumulative_return'] = (1 + monthly['return'] / 100).cumprod() - 1
+    
+    return monthly
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _news_filter_options(n_news: int, head_key: tuple, _news: list) -> tuple:
+    """Collect news type and symbol filter options in a single pass
+    
+    News is kept newest-first, so the count plus the head item identify the list.
+    """
+    types = set()
+    symbols = set()
+    for item in _news:
+        types.add(item['type'])
+        symbols.add(item['symbol'])
+    return sorted(types), sorted(symbols)
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _news_columns(n_news: int, head_key: tuple, _news: list) -> tuple:
+    """Columnar type/symbol arrays of the news feed, for vectorized filtering"""
+    types = np.array([item['type'] for item in _news], dtype=str)
+    symbols = np.array([item['symbol'] for item in _news], dtype=str)
+    return types, symbols
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _log_columns(n_logs: int, tail_key: tuple, _logs: list) -> tuple:
+    """Columnar level/lowercased-message arrays of the log feed, for vectorized filtering"""
+    levels = np.array([log['level'] for log in _logs], dtype=str)
+    messages_lower = np.array([log['message_lower'] for log in _logs], dtype=str)
+    return levels, messages_lower
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _log_level_options(n_logs: int, tail_key: tuple, _logs: list) -> list:
+    """Collect log level filter options; logs are appended, so the tail identifies the list"""
+    return sorted({log['level'] for log in _logs})
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _transaction_filter_options(n_transactions: int, last_date: str, _transactions_df: pd.DataFrame) -> tuple:
+    """Collect symbol/action filter options and the date bounds of the transaction history"""
+    symbols = sorted(_transactions_df['symbol'].unique())
+    actions = sorted(_transactions_df['action'].unique())
+    dates = _transactions_df['date']
+    return symbols, actions, dates.min().date(), dates.max().date()
+
+_FEED_PAGE_SIZE = 50
+
+def paginate_feed(items: list, key: str, newest_first: bool = True) -> list:
+    """Return one page of a news/log feed; page 1 holds the most recent entries"""
+    total_pages = -(-len(items) // _FEED_PAGE_SIZE) or 1
+    
+    page = 0
+    if total_pages > 1:
+        # Seed the page once, then keep it in range when filters shrink the feed;
+        # the widget reads its value from the key, so it gets no value= of its own
+        st.session_state.setdefault(key, 1)
+        if st.session_state[key] > total_pages:
+            st.session_state[key] = total_pages
+        page = st.number_input("Page", min_value=1, max_value=total_pages, key=key) - 1
+    
+    if newest_first:
+        return items[page * _FEED_PAGE_SIZE:(page + 1) * _FEED_PAGE_SIZE]
+    
+    # Oldest-first feeds (logs) page backwards from the tail
+    end = len(items) - page * _FEED_PAGE_SIZE
+    return items[max(end - _FEED_PAGE_SIZE, 0):end]
+
+def _session_figure(key: str, build) -> go.Figure:
+    """Return a figure built once per session; callers update its traces in place"""
+    if key not in st.session_state:
+        fig = build()
+        # Keep zoom/legend state in the browser across data updates
+        fig.update_layout(uirevision='static')
+        st.session_state[key] = fig
+    return st.session_state[key]
+
+def _build_pie_fig() -> go.Figure:
+    """Empty portfolio composition pie chart"""
+    fig = go.Figure(data=[go.Pie(
+        hole=.3,
+        marker=dict(colors=['#238636', '#2ea043', '#3fb950', '#4ac959', '#56d364'])
+    )])
+    
+    fig.update_layout(
+        plot_bgcolor='#161B22',
+        paper_bgcolor='#161B22',
+        font=dict(color='#E6EDF3'),
+        height=400
+    )
+    return fig
+
+def _build_monthly_returns_fig() -> go.Figure:
+    """Empty monthly returns bar chart"""
+    fig = go.Figure()
+    
+    fig.add_trace(go.Bar(name='Monthly Return'))
+    
+    fig.update_layout(
+        title="Monthly Returns",
+        plot_bgcolor='#161B22',
+        paper_bgcolor='#161B22',
+        font=dict(color='#E6EDF3'),
+        xaxis=dict(gridcolor='#30363D'),
+        yaxis=dict(
+            gridcolor='#30363D',
+            title='Return %',
+            tickformat='.1f',
+            ticksuffix='%'
+        ),
+        height=400
+    )
+    return fig
+
+def _build_cumulative_fig() -> go.Figure:
+    """Empty cumulative performance line chart"""
+    fig = go.Figure()
+    
+    fig.add_trace(go.Scatter(
+        name='Cumulative Return',
+        line=dict(color='#238636', width=2)
+    ))
+    
+    fig.update_layout(
+        title="Cumulative Performance",
+        plot_bgcolor='#161B22',
+        paper_bgcolor='#161B22',
+        font=dict(color='#E6EDF3'),
+        xaxis=dict(gridcolor='#30363D'),
+        yaxis=dict(
+            gridcolor='#30363D',
+            title='Return %',
+            tickformat='.1f',
+            ticksuffix='%'
+        ),
+        height=400
+    )
+    return fig
+
 def render_market_status():
     """Render market status section"""
     status = st.session_state.processor.get_market_status()
@@ -315,10 +543,6 @@ def render_portfolio_tab(state):
     """Render portfolio tab"""
     st.subheader("Portfolio Overview")
     
-    # Market Status
-    render_market_status()
-    st.markdown("---")
-    
     # Portfolio Summary
     col1, col2, col3, col4 = st.columns(4)
     
@@ -352,54 +576,36 @@ def render_portfolio_tab(state):
     # Portfolio Holdings
     st.subheader("Holdings")
     if state['portfolio']:
-        df = pd.DataFrame(state['portfolio'].values())
-        df['current_value'] = df['quantity'] * df['current_price']
-        df['pl_amount'] = df['current_value'] - (df['quantity'] * df['avg_price'])
-        df['pl_percentage'] = (df['pl_amount'] / (df['quantity'] * df['avg_price'])) * 100
-        
-        # Format the dataframe
-        df = df[[
-            'symbol', 'quantity', 'avg_price', 'current_price',
-            'current_value', 'pl_amount', 'pl_percentage'
-        ]]
-        df.columns = [
-            'Symbol', 'Quantity', 'Avg Price', 'Current Price',
-            'Current Value', 'P/L Amount', 'P/L %'
-        ]
-        
-        # Apply formatting
-        df['Avg Price'] = df['Avg Price'].apply(format_currency)
-        df['Current Price'] = df['Current Price'].apply(format_currency)
-        df['Current Value'] = df['Current Value'].apply(format_currency)
-        df['P/L Amount'] = df['P/L Amount'].apply(format_currency)
-        df['P/L %'] = df['P/L %'].apply(format_percentage)
+        df = _build_portfolio_df(_state_version(), len(state['portfolio']), state['portfolio'])
         
         st.dataframe(
             df,
             use_container_width=True,
-            hide_index=True
+            hide_index=True,
+            column_config={
+                'Avg Price': _CURRENCY_COLUMN,
+                'Current Price': _CURRENCY_COLUMN,
+                'Current Value': _CURRENCY_COLUMN,
+                'P/L Amount': _CURRENCY_COLUMN,
+                'P/L %': _PERCENT_COLUMN
+            }
         )
     else:
         st.info("No holdings in portfolio")
     
     # Recent Transactions
     st.subheader("Recent Transactions")
-    if state['transactions']:
-        df = pd.DataFrame(state['transactions'])
-        df['value'] = df['quantity'] * df['price']
-        
-        # Format the dataframe
-        df = df[['timestamp', 'symbol', 'action', 'quantity', 'price', 'value']]
-        df.columns = ['Timestamp', 'Symbol', 'Action', 'Quantity', 'Price', 'Value']
-        
-        # Apply formatting
-        df['Price'] = df['Price'].apply(format_currency)
-        df['Value'] = df['Value'].apply(format_currency)
+    if not state['transactions_df'].empty:
+        df = _build_recent_transactions_df(_state_version(), len(state['transactions_df']), state['transactions_df'])
         
         st.dataframe(
             df,
             use_container_width=True,
-            hide_index=True
+            hide_index=True,
+            column_config={
+                'Price': _CURRENCY_COLUMN,
+                'Value': _CURRENCY_COLUMN
+            }
         )
     else:
         st.info("No recent transactions")
@@ -408,113 +614,94 @@ def render_news_tab(state):
     """Render news tab"""
     st.subheader("Market News")
     
-    # Market Status
-    render_market_status()
-    st.markdown("---")
-    
     # News filters
     col1, col2 = st.columns([1, 3])
     
+    news_items = state['news']
+    head_key = (news_items[0]['timestamp'], news_items[0]['title']) if news_items else ()
+    news_types, news_symbols = _news_filter_options(len(news_items), head_key, news_items)
+    
     with col1:
-        news_type = st.selectbox(
-            "Filter by Type",
-            ["All"] + sorted(set(news['type'] for news in state['news']))
-        )
+        news_type = st.selectbox("Filter by Type", ["All"] + news_types)
     
     with col2:
-        symbols = ["All"] + sorted(set(news['symbol'] for news in state['news']))
-        symbol = st.selectbox("Filter by Symbol", symbols)
-    
-    # Filter news
-    filtered_news = state['news']
-    if news_type != "All":
-        filtered_news = [n for n in filtered_news if n['type'] == news_type]
-    if symbol != "All":
-        filtered_news = [n for n in filtered_news if n['symbol'] == symbol]
-    
-    # Display news
-    for news in filtered_news:
-        with st.container():
-            st.markdown(
-                f"""
-                <div style='
-                    background-color: #1E1E1E;
-                    padding: 15px;
-                    border-radius: 5px;
-                    margin-bottom: 10px;
-                '>
-                    <div style='display: flex; justify-content: space-between; margin-bottom: 10px;'>
-                        <span style='color: #00FF00;'>{news['symbol']}</span>
-                        <span style='color: #FFA500;'>{news['type']}</span>
-                        <span style='color: #808080;'>{news['timestamp']}</span>
-                    </div>
-                    <div style='margin-bottom: 10px;'>
-                        <strong style='color: #FFFFFF;'>{news['title']}</strong>
-                    </div>
-                    <div style='color: #CCCCCC;'>{news['summary']}</div>
-                    <div style='margin-top: 10px;'>
-                        <span style='color: #4A90E2;'>{news['source']}</span>
-                        {f" • <a href='{news['link']}' target='_blank'>Read More</a>" if 'link' in news else ''}
-                    </div>
-                </div>
-                """,
-                unsafe_allow_html=True
-            )
+        symbol = st.selectbox("Filter by Symbol", ["All"] + news_symbols)
+    
+    # Filter news with a single combined mask
+    filtered_news = news_items
+    if news_type != "All" or symbol != "All":
+        types, symbols = _news_columns(len(news_items), head_key, news_items)
+        mask = np.ones(len(news_items), dtype=bool)
+        if news_type != "All":
+            mask &= types == news_type
+        if symbol != "All":
+            mask &= symbols == symbol
+        filtered_news = [news_items[i] for i in np.flatnonzero(mask)]
+    
+    # Display the current page of news in a single markdown call
+    page_news = paginate_feed(filtered_news, key='news_page')
+    st.markdown(format_news(page_news), unsafe_allow_html=True)
 
 def render_logs_tab(state):
     """Render system logs tab"""
     st.subheader("System Logs")
     
-    # Market Status
-    render_market_status()
-    st.markdown("---")
-    
     # Log filters
     col1, col2 = st.columns([1, 3])
     
+    logs = state['logs']
+    tail_key = (logs[-1]['timestamp'], logs[-1]['message']) if logs else ()
+    
     with col1:
         log_level = st.selectbox(
             "Filter by Level",
-            ["All"] + sorted(set(log['level'] for log in state['logs']))
+            ["All"] + _log_level_options(len(logs), tail_key, logs)
         )
     
     with col2:
         search_term = st.text_input("Search Logs", "")
     
-    # Filter logs
-    filtered_logs = state['logs']
-    if log_level != "All":
-        filtered_logs = [log for log in filtered_logs if log['level'] == log_level]
-    if search_term:
-        filtered_logs = [
-            log for log in filtered_logs
-            if search_term.lower() in log['message'].lower()
-        ]
-    
-    # Display logs
-    for log in filtered_logs:
-        level_color = {
-            'INFO': '#4A90E2',
-            'WARNING': '#FFA500',
-            'ERROR': '#FF0000'
-        }.get(log['level'], '#FFFFFF')
-        
-        st.markdown(
-            f"""
-            <div style='
-                background-color: #1E1E1E;
-                padding: 10px;
-                border-radius: 5px;
-                margin-bottom: 5px;
-                font-family: monospace;
-            '>
-                <span style='color: #808080;'>{log['timestamp']}</span>
-                <span style='color: {level_color}; margin-left: 10px;'>[{log['level']}]</span>
-                <span style='color: #FFFFFF; margin-left: 10px;'>{log['message']}</span>
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
+    # Filter logs with a single combined mask
+    filtered_logs = logs
+    if log_level != "All" or search_term:
+        levels, messages_lower = _log_columns(len(logs), tail_key, logs)
+        mask = np.ones(len(logs), dtype=bool)
+        if log_level != "All":
+            mask &= levels == log_level
+        if search_term:
+            search_lower = search_term.lower()
+            mask &= np.char.find(messages_lower, search_lower) >= 0
+        filtered_logs = [logs[i] for i in np.flatnonzero(mask)]
+    
+    # Display the current page of logs in a single markdown call
+    page_logs = paginate_feed(filtered_logs, key='logs_page', newest_first=False)
+    st.markdown(
+        "".join([format_log_entry(log) for log in page_logs]),
+        unsafe_allow_html=True
+    )
+
+@st.fragment(run_every="30s")
+def _market_status_fragment():
+    """Market status banner; the status only changes every few minutes"""
+    render_market_status()
+
+@st.fragment(run_every="1s")
+def _portfolio_fragment():
+    """Live portfolio tab, refreshed without rerunning the whole script"""
+    state = st.session_state.processor.get_current_state()
+    render_portfolio_tab(state)
+
+@st.fragment(run_every="1s")
+def _news_fragment():
+    """Live news tab, refreshed without rerunning the whole script"""
+    state = st.session_state.processor.get_current_state()
+    render_news_tab(state)
+
+@st.fragment(run_every="1s")
+def _logs_fragment():
+    """Live logs tab, refreshed without rerunning the whole script"""
+    state = st.session_state.processor.get_current_state()
+    render_logs_tab(state)
 
 def show_dashboard():
     st.title("Dashboard")
@@ -523,33 +710,25 @@ def show_dashboard():
         st.warning("Please start trading to view dashboard")
         return
     
-    # Get current state
-    state = st.session_state.processor.get_current_state()
+    # Market Status
+    _market_status_fragment()
+    st.markdown("---")
     
     # Tabs
     tab1, tab2, tab3 = st.tabs(["Portfolio", "Market News", "System Logs"])
     
     with tab1:
-        render_portfolio_tab(state)
+        _portfolio_fragment()
     
     with tab2:
-        render_news_tab(state)
+        _news_fragment()
     
     with tab3:
-        render_logs_tab(state)
-    
-    # Auto-refresh
-    time.sleep(0.1)
-    st.rerun()
+        _logs_fragment()
 
-def show_portfolio():
-    st.title("Portfolio Analysis")
-    
-    if not st.session_state.processor.is_running():
-        st.warning("Please start trading to view portfolio")
-        return
-    
-    # Get current state
+@st.fragment(run_every="1s")
+def _portfolio_analysis_fragment():
+    """Live portfolio composition, refreshed without rerunning the whole script"""
     state = st.session_state.processor.get_current_state()
     
     # Portfolio composition
@@ -560,37 +739,34 @@ def show_portfolio():
         values = [pos['market_value'] for pos in state['portfolio'].values()]
         labels = list(state['portfolio'].keys())
         
-        fig = go.Figure(data=[go.Pie(
-            labels=labels,
-            values=values,
-            hole=.3,
-            marker=dict(colors=['#238636', '#2ea043', '#3fb950', '#4ac959', '#56d364'])
-        )])
-        
-        fig.update_layout(
-            plot_bgcolor='#161B22',
-            paper_bgcolor='#161B22',
-            font=dict(color='#E6EDF3'),
-            height=400
-        )
+        fig = _session_figure('pie_fig_base', _build_pie_fig)
+        fig.data[0].labels = labels
+        fig.data[0].values = values
         
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, key="pie_fig")
         
         # Position details
         col1, col2 = st.columns(2)
         
         with col1:
             st.subheader("Position Details")
-            positions = []
-            for symbol, data in state['portfolio'].items():
-                positions.append({
-                    'Symbol': symbol,
-                    'Weight': f"{(data['market_value'] / sum(values) * 100):.1f}%",
-                    'Market Value': format_currency(data['market_value']),
-                    'P/L': format_currency(data['profit_loss'])
-                })
+            total_mv = sum(values)
+            positions_df = pd.DataFrame({
+                'Symbol': labels,
+                'Weight': np.array(values) / total_mv * 100,
+                'Market Value': values,
+                'P/L': [pos['profit_loss'] for pos in state['portfolio'].values()]
+            })
             
-            st.dataframe(pd.DataFrame(positions), use_container_width=True)
+            st.dataframe(
+                positions_df,
+                use_container_width=True,
+                column_config={
+                    'Weight': st.column_config.NumberColumn(format="%.1f%%"),
+                    'Market Value': _CURRENCY_COLUMN,
+                    'P/L': _CURRENCY_COLUMN
+                }
+            )
         
         with col2:
             st.subheader("Risk Analysis")
@@ -601,10 +777,82 @@ def show_portfolio():
             )
     else:
         st.info("No open positions")
+
+def show_portfolio():
+    st.title("Portfolio Analysis")
     
-    # Auto-refresh
-    time.sleep(0.1)
-    st.rerun()
+    if not st.session_state.processor.is_running():
+        st.warning("Please start trading to view portfolio")
+        return
+    
+    _portfolio_analysis_fragment()
+
+@st.fragment(run_every="1s")
+def _transactions_fragment():
+    """Live transactions table, filtered by the widgets rendered outside the fragment"""
+    state = st.session_state.processor.get_current_state()
+    
+    if state['transactions_df'].empty:
+        st.info("No transactions recorded")
+        return
+    
+    # First transactions arrived since the filters were drawn; rerun the page to build them
+    if 'txn_symbol' not in st.session_state:
+        st.rerun()
+    
+    df = _build_transactions_df(
+        _state_version(),
+        len(state['transactions_df']),
+        st.session_state.txn_symbol,
+        st.session_state.txn_action,
+        tuple(st.session_state.txn_date_range),
+        state['transactions_df']
+    )
+    
+    # Display with pagination; only the visible page gets formatted
+    page_size = 20
+    total_pages = -(-len(df) // page_size) or 1
+    
+    page_df = df
+    if total_pages > 1:
+        # Keyed so the page survives refreshes; seeded once, clamped when filters shrink the table
+        st.session_state.setdefault('txn_page', 1)
+        if st.session_state.txn_page > total_pages:
+            st.session_state.txn_page = total_pages
+        page = st.number_input("Page", min_value=1, max_value=total_pages, key='txn_page') - 1
+        start_idx = page * page_size
+        end_idx = start_idx + page_size
+        page_df = df.iloc[start_idx:end_idx]
+    
+    page_df = page_df.assign(date=page_df['date'].dt.strftime('%Y-%m-%d %H:%M:%S'))
+    
+    st.dataframe(
+        page_df,
+        use_container_width=True,
+        column_config={
+            'price': _CURRENCY_COLUMN,
+            'value': _CURRENCY_COLUMN,
+            'profit_loss': _CURRENCY_COLUMN
+        }
+    )
+    
+    # Summary metrics
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Total Trades", len(df))
+    
+    with col2:
+        total_value = df['value'].sum()
+        st.metric("Total Value", format_currency(total_value))
+    
+    with col3:
+        total_pl = df['profit_loss'].sum()
+        st.metric("Total P/L", format_currency(total_pl))
+    
+    with col4:
+        win_rate = (df['profit_loss'] > 0).mean() * 100
+        st.metric("Win Rate", format_percentage(win_rate))
 
 def show_transactions():
     st.title("Transaction History")
@@ -616,109 +864,39 @@ def show_transactions():
     # Get current state
     state = st.session_state.processor.get_current_state()
     
-    if state['transactions']:
-        # Create DataFrame
-        df = pd.DataFrame(state['transactions'])
-        df['date'] = pd.to_datetime(df['date'])
+    if not state['transactions_df'].empty:
+        # Filters stay outside the fragment so the table refresh doesn't rebuild them
+        transactions_df = state['transactions_df']
+        symbols, actions, first_date, last_date = _transaction_filter_options(
+            len(transactions_df), str(transactions_df['date'].iloc[-1]), transactions_df
+        )
         
-        # Filters
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            symbols = ['All'] + sorted(df['symbol'].unique().tolist())
-            symbol = st.selectbox("Symbol", symbols)
+            st.selectbox("Symbol", ['All'] + symbols, key='txn_symbol')
         
         with col2:
-            actions = ['All'] + sorted(df['action'].unique().tolist())
-            action = st.selectbox("Action", actions)
+            st.selectbox("Action", ['All'] + actions, key='txn_action')
         
         with col3:
-            date_range = st.date_input(
+            st.date_input(
                 "Date Range",
-                value=(df['date'].min().date(), df['date'].max().date())
+                value=(first_date, last_date),
+                key='txn_date_range'
             )
-        
-        # Apply filters
-        if symbol != 'All':
-            df = df[df['symbol'] == symbol]
-        if action != 'All':
-            df = df[df['action'] == action]
-        if len(date_range) == 2:
-            df = df[
-                (df['date'].dt.date >= date_range[0]) &
-                (df['date'].dt.date <= date_range[1])
-            ]
-        
-        # Sort by date
-        df = df.sort_values('date', ascending=False)
-        
-        # Format values
-        display_df = df.copy()
-        display_df['date'] = display_df['date'].dt.strftime('%Y-%m-%d %H:%M:%S')
-        display_df['price'] = display_df['price'].apply(format_currency)
-        display_df['value'] = display_df['value'].apply(format_currency)
-        display_df['profit_loss'] = display_df['profit_loss'].apply(format_currency)
-        
-        # Display with pagination
-        page_size = 20
-        total_pages = len(display_df) // page_size + (1 if len(display_df) % page_size > 0 else 0)
-        
-        if total_pages > 1:
-            page = st.number_input("Page", min_value=1, max_value=total_pages, value=1) - 1
-            start_idx = page * page_size
-            end_idx = start_idx + page_size
-            display_df = display_df.iloc[start_idx:end_idx]
-        
-        st.dataframe(display_df, use_container_width=True)
-        
-        # Summary metrics
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric("Total Trades", len(df))
-        
-        with col2:
-            total_value = df['value'].sum()
-            st.metric("Total Value", format_currency(total_value))
-        
-        with col3:
-            total_pl = df['profit_loss'].sum()
-            st.metric("Total P/L", format_currency(total_pl))
-        
-        with col4:
-            win_rate = (df['profit_loss'] > 0).mean() * 100
-            st.metric("Win Rate", format_percentage(win_rate))
-    else:
-        st.info("No transactions recorded")
     
-    # Auto-refresh
-    time.sleep(0.1)
-    st.rerun()
+    _transactions_fragment()
 
-def show_monthly_results():
-    st.title("Monthly Results")
-    
-    if not st.session_state.processor.is_running():
-        st.warning("Please start trading to view results")
-        return
-    
+@st.fragment(run_every="1s")
+def _monthly_results_fragment():
+    """Live monthly results, refreshed without rerunning the whole script"""
     # Get current state
     state = st.session_state.processor.get_current_state()
     
-    if state['transactions']:
-        # Create DataFrame
-        df = pd.DataFrame(state['transactions'])
-        df['date'] = pd.to_datetime(df['date'])
-        df = df.sort_values('date')
-        
-        # Calculate monthly metrics
-        monthly = df.set_index('date').resample('M').agg({
-            'value': 'sum',
-            'profit_loss': 'sum'
-        }).reset_index()
-        
-        monthly['return'] = monthly['profit_loss'] / monthly['value'] * 100
-        monthly['cumulative_return'] = (1 + monthly['return'] / 100).cumprod() - 1
+    if not state['transactions_df'].empty:
+        transactions_df = state['transactions_df']
+        monthly = _compute_monthly(len(transactions_df), str(transactions_df['date'].iloc[-1]), transactions_df)
         
         # Display metrics
         col1, col2, col3, col4 = st.columns(4)
@@ -746,76 +924,50 @@ def show_monthly_results():
         tab1, tab2 = st.tabs(["Monthly Returns", "Cumulative Performance"])
         
         with tab1:
-            fig1 = go.Figure()
-            
-            fig1.add_trace(go.Bar(
-                x=monthly['date'],
-                y=monthly['return'],
-                name='Monthly Return',
-                marker_color=['#238636' if x >= 0 else '#f85149' for x in monthly['return']]
-            ))
+            returns = chart_points(monthly, 'date', 'return')
+            fig1 = _session_figure('monthly_returns_fig_base', _build_monthly_returns_fig)
+            fig1.data[0].x = returns['date']
+            fig1.data[0].y = returns['return']
+            fig1.data[0].marker.color = ['#238636' if x >= 0 else '#f85149' for x in returns['return']]
             
-            fig1.update_layout(
-                title="Monthly Returns",
-                plot_bgcolor='#161B22',
-                paper_bgcolor='#161B22',
-                font=dict(color='#E6EDF3'),
-                xaxis=dict(gridcolor='#30363D'),
-                yaxis=dict(
-                    gridcolor='#30363D',
-                    title='Return %',
-                    tickformat='.1f',
-                    ticksuffix='%'
-                ),
-                height=400
-            )
-            
-            st.plotly_chart(fig1, use_container_width=True)
+            st.plotly_chart(fig1, use_container_width=True, key="monthly_returns_fig")
         
         with tab2:
-            fig2 = go.Figure()
-            
-            fig2.add_trace(go.Scatter(
-                x=monthly['date'],
-                y=monthly['cumulative_return'] * 100,
-                name='Cumulative Return',
-                line=dict(color='#238636', width=2)
-            ))
-            
-            fig2.update_layout(
-                title="Cumulative Performance",
-                plot_bgcolor='#161B22',
-                paper_bgcolor='#161B22',
-                font=dict(color='#E6EDF3'),
-                xaxis=dict(gridcolor='#30363D'),
-                yaxis=dict(
-                    gridcolor='#30363D',
-                    title='Return %',
-                    tickformat='.1f',
-                    ticksuffix='%'
-                ),
-                height=400
-            )
+            cumulative = chart_points(monthly, 'date', 'cumulative_return')
+            fig2 = _session_figure('cumulative_fig_base', _build_cumulative_fig)
+            fig2.data[0].x = cumulative['date']
+            fig2.data[0].y = cumulative['cumulative_return'] * 100
             
-            st.plotly_chart(fig2, use_container_width=True)
+            st.plotly_chart(fig2, use_container_width=True, key="cumulative_fig")
         
         # Monthly details table
         st.subheader("Monthly Details")
         
         display_df = monthly.copy()
         display_df['date'] = display_df['date'].dt.strftime('%Y-%m')
-        display_df['value'] = display_df['value'].apply(format_currency)
-        display_df['profit_loss'] = display_df['profit_loss'].apply(format_currency)
-        display_df['return'] = display_df['return'].apply(format_percentage)
-        display_df['cumulative_return'] = (display_df['cumulative_return'] * 100).apply(format_percentage)
+        display_df['cumulative_return'] = display_df['cumulative_return'] * 100
         
-        st.dataframe(display_df, use_container_width=True)
+        st.dataframe(
+            display_df,
+            use_container_width=True,
+            column_config={
+                'value': _CURRENCY_COLUMN,
+                'profit_loss': _CURRENCY_COLUMN,
+                'return': _PERCENT_COLUMN,
+                'cumulative_return': _PERCENT_COLUMN
+            }
+        )
     else:
         st.info("No monthly results available")
+
+def show_monthly_results():
+    st.title("Monthly Results")
+    
+    if not st.session_state.processor.is_running():
+        st.warning("Please start trading to view results")
+        return
     
-    # Auto-refresh
-    time.sleep(0.1)
-    st.rerun()
+    _monthly_results_fragment()
 
 # Display selected page
 if st.session_state.page == "Dashboard":
@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+
+_MAX_CHART_POINTS = 500
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets downsampling; returns indices of the points to keep"""
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    
+    # First and last points are always kept; the rest is split into threshold - 2 buckets
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    keep = np.empty(threshold, dtype=np.int64)
+    keep[0] = 0
+    keep[-1] = n - 1
+    
+    selected = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start, next_end = (edges[i + 1], edges[i + 2]) if i + 2 < len(edges) else (n - 1, n)
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+        
+        # Pick the point forming the largest triangle with the previous pick and the next bucket's mean
+        area = np.abs(
+            (x[selected] - avg_x) * (y[start:end] - y[selected]) -
+            (x[selected] - x[start:end]) * (avg_y - y[selected])
+        )
+        selected = start + int(area.argmax())
+        keep[i + 1] = selected
+    
+    return keep
+
+def chart_points(df: pd.DataFrame, x_col: str, y_col: str) -> pd.DataFrame:
+    """Downsample a time series to at most _MAX_CHART_POINTS rows before plotting"""
+    if len(df) <= _MAX_CHART_POINTS:
+        return df
+    x = df[x_col].to_numpy().astype(np.int64).astype(np.float64)
+    y = df[y_col].to_numpy(dtype=np.float64)
+    return df.iloc[lttb_indices(x, y, _MAX_CHART_POINTS)]
@@ -2,27 +2,131 @@ from typing import Dict, Any, Optional, List
 from datetime import datetime
 import threading
 import queue
-import time
-import subprocess
+import asyncio
+import functools
+import multiprocessing
+from collections import deque
 from pathlib import Path
 import json
+import os
+from types import MappingProxyType
+import orjson
+import pandas as pd
 from .trading import TradingSimulator
 from .market_hours import MarketHours
 from .news_scraper import NewsAggregator
 from .test_data import get_nifty50_symbols
 from .finmem_integration import FinMemManager
 
+# Feeds the news process may have waiting; each one replaces the last, so a few is plenty
+NEWS_QUEUE_SIZE = 4
+
+# Columns of the transaction frame handed to the UI
+TRANSACTION_COLUMNS = ('date', 'symbol', 'action', 'quantity', 'price', 'value', 'profit_loss')
+
+def _write_json(path: Path, data: Any, option: int = 0):
+    """Serialize with orjson and swap the file in atomically, so a crash never leaves it half-written"""
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(orjson.dumps(data, option=option | orjson.OPT_SERIALIZE_NUMPY))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def _run_news(symbols: List[str], updates, stop_event):
+    """News worker process: run the aggregator and publish the feed whenever it changes"""
+    aggregator = NewsAggregator(symbols)
+    aggregator.start()
+    
+    published_key = None
+    while not stop_event.wait(1.0):
+        news = aggregator.get_latest_news()
+        
+        # The feed is newest-first, so its length and head identify it
+        news_key = (len(news), news[0]['timestamp'], news[0]['title']) if news else ()
+        if news_key != published_key:
+            # The queue is bounded; if the consumer falls behind, retry on the next tick
+            try:
+                updates.put_nowait(list(news))
+            except queue.Full:
+                continue
+            published_key = news_key
+    
+    aggregator.stop()
+
+def _run_simulator(config: Dict[str, Any], states, commands, stop_event):
+    """Simulator worker process: step the simulation during market hours and publish its state
+    
+    Publishes ('state', state, new_transactions, replace) after each change, where
+    new_transactions holds only the rows recorded since the previous publish and replace
+    marks a fresh history (first publish or capital reset), and ('error', message) when a
+    step fails.
+    """
+    simulator = TradingSimulator(config)
+    market_hours = MarketHours()
+    sent = 0  # Transactions already published
+    replace = True
+    
+    while not stop_event.is_set():
+        try:
+            # Apply commands sent from the UI process
+            changed = replace
+            while True:
+                try:
+                    command, value = commands.get_nowait()
+                except queue.Empty:
+                    break
+                if command == 'reset_capital':
+                    simulator.reset_capital(value)
+                    sent = 0
+                    replace = True
+                    changed = True
+            
+            # Only update simulation during market hours
+            if market_hours.is_market_open():
+                simulator.update()
+                changed = True
+            
+            if changed:
+                states.put(('state', simulator.get_state(), simulator.transactions_since(sent), replace))
+                sent = simulator.transaction_count
+                replace = False
+            
+            # Tick quickly while the simulation moves, slowly while it is idle
+            stop_event.wait(0.1 if changed else 1.0)
+            
+        except Exception as e:
+            states.put(('error', str(e)))
+            stop_event.wait(1)
+    
+    # Persist whatever the last few updates changed and stop the writer thread
+    simulator.close()
+
 class DataProcessor:
     def __init__(self):
         self.mode = None  # 'test' or 'real'
-        self.simulator = None
+        self.simulator_process = None  # Runs TradingSimulator off the GIL in test mode
+        self._simulator_states = None
+        self._simulator_commands = None
+        self._simulator_stop = None
         self.finmem = None
         self.running = False
-        self.data_thread = None
-        self.data_queue = queue.Queue()
+        self.data_thread = None  # Runs the asyncio loop that drives all updates
+        self.finmem_process = None
+        self._state_lock = threading.Lock()  # Guards every read and write of current_state
         self.last_update = None
         self.market_hours = MarketHours()
-        self.news_aggregator = None
+        self._last_status_key = None  # Minute the market status was last computed for
+        self._state_dirty = threading.Event()  # Set when there is unsaved state
+        self._save_interval = 5.0  # Seconds between state file writes
+        
+        # Create the output directories once rather than on every write
+        Path("data").mkdir(parents=True, exist_ok=True)
+        Path("config").mkdir(parents=True, exist_ok=True)
+        self.news_process = None  # Runs NewsAggregator and its scrape loop
+        self._news_updates = None
+        self._news_stop = None
+        self.max_logs = 1000  # Maximum number of log entries to keep
         self.current_state = {
             'user': None,
             'capital': 0,
@@ -35,10 +139,11 @@ class DataProcessor:
             'risk_profile': None,
             'last_update': None,
             'news': [],
-            'logs': [],
+            'logs': deque(maxlen=self.max_logs),  # Oldest entries drop off on append
             'market_status': None
         }
-        self.max_logs = 1000  # Maximum number of log entries to keep
+        self.max_transactions = 10_000  # Same cap as TradingSimulator; older rows drop off the UI frame
+        self._reset_transactions()
     
     def start(self, mode: str, config: Dict[str, Any]):
         """Start data processing in specified mode"""
@@ -48,10 +153,16 @@ class DataProcessor:
         self.mode = mode
         self.running = True
         
-        # Initialize news aggregator
+        # Run news aggregation in its own process
         symbols = get_nifty50_symbols()
-        self.news_aggregator = NewsAggregator(symbols)
-        self.news_aggregator.start()
+        self._news_updates = multiprocessing.Queue(maxsize=NEWS_QUEUE_SIZE)
+        self._news_stop = multiprocessing.Event()
+        self.news_process = multiprocessing.Process(
+            target=_run_news,
+            args=(symbols, self._news_updates, self._news_stop)
+        )
+        self.news_process.daemon = True
+        self.news_process.start()
         self._add_log("Started news aggregation")
         
         # Load previous state for real-time mode
@@ -71,10 +182,8 @@ class DataProcessor:
                 self.finmem.initialize(config)
                 self._add_log("Initialized FinMem trading")
                 
-                # Start data processing thread
-                self.data_thread = threading.Thread(target=self._run_real_updates)
-                self.data_thread.daemon = True
-                self.data_thread.start()
+                # Start data processing loop
+                self._start_loop(asyncio.new_event_loop(), self._run_finmem_updates())
                 
             except Exception as e:
                 self.running = False
@@ -83,13 +192,19 @@ class DataProcessor:
                 raise Exception(error_msg)
         
         elif mode == 'test':
-            # Initialize test simulator
-            self.simulator = TradingSimulator(config)
+            # Run the test simulator in its own process
+            self._simulator_states = multiprocessing.Queue()
+            self._simulator_commands = multiprocessing.Queue()
+            self._simulator_stop = multiprocessing.Event()
+            self.simulator_process = multiprocessing.Process(
+                target=_run_simulator,
+                args=(config, self._simulator_states, self._simulator_commands, self._simulator_stop)
+            )
+            self.simulator_process.daemon = True
+            self.simulator_process.start()
             
-            # Start update thread
-            self.data_thread = threading.Thread(target=self._run_test_updates)
-            self.data_thread.daemon = True
-            self.data_thread.start()
+            # Start update loop
+            self._start_loop(asyncio.new_event_loop(), self._run_test_updates())
             
             # Log startup
             self._add_log("Started test mode simulation")
@@ -97,30 +212,22 @@ class DataProcessor:
         else:  # real-time mode
             # Save configuration
             config_path = Path("config/finmem_config.json")
-            config_path.parent.mkdir(exist_ok=True)
-            with open(config_path, "w") as f:
-                json.dump(config, f)
+            _write_json(config_path, config)
             
             # Start FinMem India process
             try:
                 self._add_log("Starting FinMem India process...")
-                self.finmem_process = subprocess.Popen(
-                    ["python", "finmem_india/main.py", "--config", str(config_path)],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    universal_newlines=True,
-                    bufsize=1  # Line buffered
-                )
                 
-                # Start data processing thread
-                self.data_thread = threading.Thread(target=self._run_real_updates)
-                self.data_thread.daemon = True
-                self.data_thread.start()
+                # Spawn on the loop before handing it to the thread, so failures raise here
+                loop = asyncio.new_event_loop()
+                self.finmem_process = loop.run_until_complete(asyncio.create_subprocess_exec(
+                    "python", "finmem_india/main.py", "--config", str(config_path),
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                ))
                 
-                # Start error stream reader thread
-                self.error_thread = threading.Thread(target=self._monitor_errors)
-                self.error_thread.daemon = True
-                self.error_thread.start()
+                # Updates and the error stream share the same loop
+                self._start_loop(loop, self._run_finmem_process())
                 
                 self._add_log("FinMem India process started successfully")
                 
@@ -138,25 +245,34 @@ class DataProcessor:
         self._add_log("Stopping data processing...")
         self.running = False
         
-        if self.finmem_process:
-            self._add_log("Terminating FinMem India process...")
-            self.finmem_process.terminate()
-            self.finmem_process = None
-        
+        # The update loop exits on its next tick and terminates FinMem itself
         if self.data_thread:
             self.data_thread.join(timeout=1)
             self.data_thread = None
         
-        if hasattr(self, 'error_thread'):
-            self.error_thread.join(timeout=1)
+        # Flush anything the periodic writer hasn't saved yet
+        if self._state_dirty.is_set():
+            self._state_dirty.clear()
+            self._save_state()
+        
+        if self.simulator_process:
+            self._simulator_stop.set()
+            self.simulator_process.join(timeout=1)
+            if self.simulator_process.is_alive():
+                self.simulator_process.terminate()
+            self.simulator_process = None
         
-        if self.news_aggregator:
-            self.news_aggregator.stop()
+        if self.news_process:
+            self._news_stop.set()
+            self.news_process.join(timeout=1)
+            if self.news_process.is_alive():
+                self.news_process.terminate()
+            self.news_process = None
             self._add_log("Stopped news aggregation")
         
-        self.simulator = None
         self.mode = None
         self.last_update = None
+        self._last_status_key = None
         self._add_log("Data processing stopped")
     
     def _add_log(self, message: str, level: str = "INFO"):
@@ -165,131 +281,294 @@ class DataProcessor:
         log_entry = {
             'timestamp': timestamp,
             'level': level,
-            'message': message
+            'message': message,
+            'message_lower': message.lower()  # Lowered once for the log search
         }
         
-        self.current_state['logs'].append(log_entry)
+        with self._state_lock:
+            self.current_state['logs'].append(log_entry)
+    
+    def _start_loop(self, loop: asyncio.AbstractEventLoop, main):
+        """Run the update coroutine on its own event loop in a single daemon thread"""
+        self.data_thread = threading.Thread(target=self._run_loop, args=(loop, main))
+        self.data_thread.daemon = True
+        self.data_thread.start()
+    
+    def _run_loop(self, loop: asyncio.AbstractEventLoop, main):
+        """Thread target: drive the loop until the update coroutine returns"""
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(main)
+        finally:
+            loop.close()
+    
+    async def _run_finmem_updates(self):
+        """Run real-time updates from the in-process FinMem alongside the periodic state writer"""
+        flusher = asyncio.ensure_future(self._flush_state())
         
-        # Keep only the last max_logs entries
-        if len(self.current_state['logs']) > self.max_logs:
-            self.current_state['logs'] = self.current_state['logs'][-self.max_logs:]
+        await self._run_real_updates()
         
-        # Update UI
-        self.data_queue.put(self.current_state.copy())
+        # stop() does the final flush
+        flusher.cancel()
     
-    def _monitor_errors(self):
+    async def _run_finmem_process(self):
+        """Run real-time updates alongside the FinMem process output and error streams"""
+        process = self.finmem_process
+        reader = asyncio.ensure_future(self._read_updates())
+        monitor = asyncio.ensure_future(self._monitor_errors())
+        flusher = asyncio.ensure_future(self._flush_state())
+        
+        await self._run_real_updates()
+        
+        # stop() does the final flush
+        flusher.cancel()
+        
+        # Terminating the process closes its pipes, which ends the reader and the monitor
+        if process.returncode is None:
+            self._add_log("Terminating FinMem India process...")
+            process.terminate()
+        await reader
+        await monitor
+        await process.wait()
+        self.finmem_process = None
+    
+    async def _flush_state(self):
+        """Write the state at most once per save interval while updates keep marking it dirty"""
+        while self.running:
+            await asyncio.sleep(self._save_interval)
+            if self._state_dirty.is_set():
+                self._state_dirty.clear()
+                # Serialize and write on a worker thread so the loop keeps ticking
+                await asyncio.get_running_loop().run_in_executor(None, self._save_state)
+    
+    async def _read_updates(self):
+        """Feed each line the FinMem process writes to stdout into _process_real_data"""
+        stdout = self.finmem_process.stdout
+        pending = b""
+        try:
+            # Same manual line splitting as _monitor_errors; draining stdout also keeps
+            # the process from blocking on a full pipe
+            while True:
+                chunk = await stdout.read(65536)
+                if not chunk:
+                    break
+                *lines, pending = (pending + chunk).split(b"\n")
+                for data_line in lines:
+                    if data_line.strip():
+                        self._process_real_data(data_line.decode(errors="replace"))
+            
+            if pending.strip():
+                self._process_real_data(pending.decode(errors="replace"))
+        except Exception as e:
+            print(f"Error reading stdout: {str(e)}")
+    
+    async def _monitor_errors(self):
         """Monitor the error stream from FinMem process"""
-        while self.running and self.finmem_process:
+        stderr = self.finmem_process.stderr
+        pending = b""
+        try:
+            # Read whatever is available and split lines ourselves, so an
+            # overlong line can't trip the StreamReader line limit
+            while True:
+                chunk = await stderr.read(4096)
+                if not chunk:
+                    break
+                *lines, pending = (pending + chunk).split(b"\n")
+                for error_line in lines:
+                    self._add_log(error_line.decode(errors="replace").strip(), level="ERROR")
+            
+            if pending.strip():
+                self._add_log(pending.decode(errors="replace").strip(), level="ERROR")
+        except Exception as e:
+            print(f"Error monitoring stderr: {str(e)}")
+    
+    def _drain_news(self) -> Optional[List[Dict[str, Any]]]:
+        """Return the newest feed published by the news process, or None if nothing new arrived"""
+        news = None
+        while True:
             try:
-                error_line = self.finmem_process.stderr.readline()
-                if error_line:
-                    self._add_log(error_line.strip(), level="ERROR")
-            except Exception as e:
-                print(f"Error monitoring stderr: {str(e)}")
-                time.sleep(1)
+                news = self._news_updates.get_nowait()
+            except queue.Empty:
+                return news
     
-    def _update_market_status(self):
-        """Update market status"""
-        self.current_state['market_status'] = self.market_hours.get_market_status()
+    def _update_market_status(self, now: datetime):
+        """Update market status as of the tick time (IST)"""
+        # Every session boundary falls on a whole minute, so the status (and its
+        # "in N minutes" message) can only change when the minute does
+        status_key = now.replace(second=0, microsecond=0)
+        if status_key == self._last_status_key:
+            return
+        self._last_status_key = status_key
+        
+        market_status = self.market_hours.get_market_status(now)
+        with self._state_lock:
+            self.current_state = {**self.current_state, 'market_status': market_status}
         
         # Log market status changes
-        status = self.current_state['market_status']['status']
-        message = self.current_state['market_status']['message']
+        status = market_status['status']
+        message = market_status['message']
         self._add_log(f"Market Status: {status} - {message}")
     
-    def _run_test_updates(self):
+    async def _run_test_updates(self):
         """Run test simulation updates"""
+        loop = asyncio.get_running_loop()
+        wait_for_simulator = functools.partial(self._simulator_states.get, timeout=1.0)
+        
         while self.running:
             try:
+                # Wake as soon as the simulator publishes; time out after a second so
+                # the market status keeps moving while the market is closed
+                messages = []
+                try:
+                    messages.append(await loop.run_in_executor(None, wait_for_simulator))
+                except queue.Empty:
+                    pass
+                while True:
+                    try:
+                        messages.append(self._simulator_states.get_nowait())
+                    except queue.Empty:
+                        break
+                
+                # One clock read per tick, shared by the status check and the update stamp
+                now = datetime.now(self.market_hours.ist_tz)
+                
                 # Update market status
-                self._update_market_status()
+                self._update_market_status(now)
                 
-                # Only update simulation during market hours
-                if self.market_hours.is_market_open():
-                    # Update simulator
-                    self.simulator.update()
-                    
-                    # Get current state
-                    state = self.simulator.get_state()
-                    
-                    # Update current state
-                    self.current_state.update({
-                        'user': state['user'],
-                        'capital': state['capital'],
-                        'initial_capital': state['initial_capital'],
-                        'total_value': state['total_value'],
-                        'total_pl': state['total_pl'],
-                        'pl_pct': state['pl_pct'],
-                        'portfolio': state['portfolio'],
-                        'transactions': state['transactions'],
-                        'risk_profile': state['risk_profile']
-                    })
-                    
-                    self.last_update = datetime.now()
-                    
-                    # Update news
-                    if self.news_aggregator:
-                        self.current_state['news'] = self.news_aggregator.get_latest_news()
-                    
-                    # Put state in queue for UI
-                    self.data_queue.put(self.current_state.copy())
+                # Drain the news feed every tick, also while the simulator is idle, so the queue never backs up
+                news = self._drain_news()
+                if news is not None:
+                    with self._state_lock:
+                        self.current_state = {**self.current_state, 'news': news}
                 
-                # Small delay between updates
-                time.sleep(0.1)
+                # Keep only the newest state the simulator process published, but every new transaction
+                state = None
+                added = []
+                replace = False
+                for message in messages:
+                    if message[0] == 'error':
+                        self._add_log(f"Error in test updates: {message[1]}", level="ERROR")
+                        continue
+                    _, state, transactions, reset = message
+                    if reset:
+                        added = list(transactions)
+                        replace = True
+                    else:
+                        added.extend(transactions)
+                
+                if state is not None:
+                    # The simulator state is already shaped like current_state
+                    delta = state
+                    delta['last_update'] = now
+                    
+                    # Swap in a new state dict rather than updating keys in place; in test mode the
+                    # transactions live only in the UI frame, which takes just the new rows
+                    with self._state_lock:
+                        self.current_state = {**self.current_state, **delta}
+                        if replace:
+                            self._reset_transactions()
+                        self._append_transactions(added)
+                        self.last_update = now
                 
             except Exception as e:
                 error_msg = f"Error in test updates: {str(e)}"
                 self._add_log(error_msg, level="ERROR")
-                time.sleep(1)
+                await asyncio.sleep(1)
     
-    def _run_real_updates(self):
+    async def _run_real_updates(self):
         """Process real-time updates from FinMem"""
         while self.running:
             try:
+                # One clock read per tick, shared by the status check and the update stamp
+                now = datetime.now(self.market_hours.ist_tz)
+                
                 # Update market status
-                self._update_market_status()
+                self._update_market_status(now)
                 
                 if self.finmem:
                     # Get latest state from FinMem
                     state = self.finmem.update()
                     
-                    # Update current state
-                    self.current_state.update(state)
-                    self.last_update = datetime.now()
+                    delta = dict(state)
                     
                     # Update news
-                    if self.news_aggregator:
-                        self.current_state['news'] = self.news_aggregator.get_latest_news()
+                    news = self._drain_news()
+                    if news is not None:
+                        delta['news'] = news
                     
-                    # Put updated state in queue for UI
-                    self.data_queue.put(self.current_state.copy())
+                    # Update current state
+                    with self._state_lock:
+                        self.current_state = {**self.current_state, **delta}
+                        self._sync_transactions()
+                        self.last_update = now
+                    
+                    # Saved by the periodic writer, not on every update
+                    self._state_dirty.set()
                 
-                time.sleep(1)  # Update every second
+                await asyncio.sleep(1)  # Update every second
                 
             except Exception as e:
                 error_msg = f"Error in real-time updates: {str(e)}"
                 self._add_log(error_msg, level="ERROR")
-                time.sleep(1)
+                await asyncio.sleep(1)
+    
+    def _reset_transactions(self):
+        """Start an empty transaction frame"""
+        self._transactions_seen = 0  # Entries of current_state['transactions'] already in the frame
+        self._transactions_df = pd.DataFrame(columns=list(TRANSACTION_COLUMNS))
+    
+    def _sync_transactions(self):
+        """Append transactions added to current_state since the last sync to the UI frame"""
+        transactions = self.current_state['transactions']
+        if len(transactions) == self._transactions_seen:
+            return
+        
+        # History shrank (capital reset), start over
+        if len(transactions) < self._transactions_seen:
+            self._reset_transactions()
+        
+        self._append_transactions(transactions[self._transactions_seen:])
+        self._transactions_seen = len(transactions)
+    
+    def _append_transactions(self, transactions: List[Dict[str, Any]]):
+        """Convert only the new transactions and append them to the UI frame, keeping the latest max_transactions"""
+        if not transactions:
+            return
+        
+        new = pd.DataFrame({
+            'date': pd.to_datetime([txn.get('date', txn.get('timestamp')) for txn in transactions]),
+            'symbol': [txn['symbol'] for txn in transactions],
+            'action': [txn['action'] for txn in transactions],
+            'quantity': [txn['quantity'] for txn in transactions],
+            'price': [txn['price'] for txn in transactions],
+            'value': [txn.get('value', txn['quantity'] * txn['price']) for txn in transactions],
+            'profit_loss': [txn.get('profit_loss', 0) for txn in transactions]
+        })
+        
+        # The empty starting frame has no dtypes to keep, so the first batch replaces it
+        df = pd.concat([self._transactions_df, new], ignore_index=True) if len(self._transactions_df) else new
+        if len(df) > self.max_transactions:
+            df = df.iloc[-self.max_transactions:].reset_index(drop=True)
+        self._transactions_df = df
     
     def _save_state(self):
         """Save current state to file"""
         if self.mode == 'real':  # Only save state in real-time mode
             state_file = Path("data/finmem_state.json")
-            state_file.parent.mkdir(exist_ok=True)
             
             # Save relevant state data
-            save_data = {
-                'capital': self.current_state['capital'],
-                'initial_capital': self.current_state['initial_capital'],
-                'portfolio': self.current_state['portfolio'],
-                'transactions': self.current_state['transactions'],
-                'risk_profile': self.current_state['risk_profile'],
-                'user': self.current_state['user'],
-                'last_update': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            }
+            with self._state_lock:
+                save_data = {
+                    'capital': self.current_state['capital'],
+                    'initial_capital': self.current_state['initial_capital'],
+                    'portfolio': self.current_state['portfolio'],
+                    'transactions': self.current_state['transactions'],
+                    'risk_profile': self.current_state['risk_profile'],
+                    'user': self.current_state['user'],
+                    'last_update': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                }
             
-            with open(state_file, "w") as f:
-                json.dump(save_data, f, indent=2)
+            _write_json(state_file, save_data, orjson.OPT_INDENT_2)
     
     def _load_state(self):
         """Load previous state from file"""
@@ -300,7 +579,9 @@ class DataProcessor:
                     saved_state = json.load(f)
                 
                 # Update current state with saved data
-                self.current_state.update(saved_state)
+                with self._state_lock:
+                    self.current_state = {**self.current_state, **saved_state}
+                    self._sync_transactions()
                 self._add_log("Loaded previous trading state")
             except Exception as e:
                 self._add_log(f"Error loading previous state: {str(e)}", level="ERROR")
@@ -315,8 +596,8 @@ class DataProcessor:
                 else:
                     self._add_log("Failed to reset capital", level="ERROR")
         else:  # test mode
-            if self.simulator:
-                self.simulator.reset_capital(new_capital)
+            if self.simulator_process:
+                self._simulator_commands.put(('reset_capital', new_capital))
                 self._add_log(f"Reset capital to {new_capital}")
     
     def _process_real_data(self, data_line: str):
@@ -326,14 +607,13 @@ class DataProcessor:
             
             # Update state based on data type
             if data.get("type") == "state_update":
-                self.current_state.update(data["state"])
-                self.last_update = datetime.now()
+                with self._state_lock:
+                    self.current_state = {**self.current_state, **data["state"]}
+                    self._sync_transactions()
+                    self.last_update = datetime.now()
                 
-                # Save state after each update
-                self._save_state()
-            
-            # Put updated state in queue for UI
-            self.data_queue.put(self.current_state.copy())
+                # Saved by the periodic writer, not on every update
+                self._state_dirty.set()
             
         except json.JSONDecodeError:
             self._add_log(f"Invalid JSON data: {data_line}", level="ERROR")
@@ -341,8 +621,12 @@ class DataProcessor:
             self._add_log(f"Error processing data: {str(e)}", level="ERROR")
     
     def get_current_state(self) -> Dict[str, Any]:
-        """Get current state data"""
-        return self.current_state.copy()
+        """Get a snapshot of the current state, built only when the UI asks for it"""
+        with self._state_lock:
+            state = dict(self.current_state)
+            state['logs'] = list(state['logs'])
+            state['transactions_df'] = self._transactions_df
+        return state
     
     def is_running(self) -> bool:
         """Check if data processing is running"""
@@ -353,13 +637,17 @@ class DataProcessor:
         return self.last_update
     
     def get_market_status(self) -> Dict[str, Any]:
-        """Get current market status"""
-        return self.current_state['market_status']
+        """Get a read-only view of the current market status"""
+        with self._state_lock:
+            market_status = self.current_state['market_status']
+        return MappingProxyType(market_status) if market_status is not None else None
     
     def get_news(self) -> List[Dict[str, Any]]:
         """Get current news items"""
-        return self.current_state['news']
+        with self._state_lock:
+            return self.current_state['news']
     
     def get_logs(self) -> List[Dict[str, Any]]:
         """Get current logs"""
-        return self.current_state['logs'] 
\ No newline at end of file
+        with self._state_lock:
+            return list(self.current_state['logs']) 
\ No newline at end of file
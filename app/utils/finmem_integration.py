@@ -1,13 +1,36 @@
-import requests
 import json
 from typing import Dict, Any, Optional
 from datetime import datetime
 import os
 from pathlib import Path
 import toml
+import copy
 from puppy.core.simulation import Simulation
 from puppy.utils.config import load_config
 
+# Used when config/config.toml is missing or unreadable
+DEFAULT_CONFIG = {
+    "market": {
+        "data_path": "data/market",
+        "symbols": []
+    },
+    "trading": {
+        "initial_capital": 100000,
+        "position_size_limit": 0.2
+    },
+    "agent": {
+        "model": "gpt-4",
+        "risk_profile": "moderate"
+    },
+    "chat": {
+        "system_prompt": "You are an expert Indian stock market trader.",
+        "max_tokens": 500
+    },
+    "memory": {
+        "max_days": 30
+    }
+}
+
 class FinMemAPI:
     def __init__(self, api_key: str = None):
         self.api_key = api_key or os.getenv('FINMEM_API_KEY')
@@ -15,57 +38,68 @@ class FinMemAPI:
             raise ValueError("FinMem API key not provided")
         
         self.base_url = "https://api.finmem.in/v1"  # Update with actual API endpoint
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.headers = {
             'Authorization': f'Bearer {self.api_key}',
             'Content-Type': 'application/json'
-        })
+        }
+        # Imported here so the rest of the app loads without httpx installed
+        import httpx
+        
+        # One pooled HTTP/2 connection per host; retries absorb transient connect errors
+        self.session = httpx.Client(
+            headers=self.headers,
+            timeout=httpx.Timeout(5.0),
+            transport=httpx.HTTPTransport(http2=True, retries=2)
+        )
+        
+        # Endpoint URLs
+        self._url_account_initialize = f"{self.base_url}/account/initialize"
+        self._url_account_status = f"{self.base_url}/account/status"
+        self._url_orders = f"{self.base_url}/orders"
+        self._url_positions = f"{self.base_url}/positions"
+        self._url_market_data = f"{self.base_url}/market/data"
     
     def initialize_account(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Initialize or get trading account details"""
-        endpoint = f"{self.base_url}/account/initialize"
-        response = self.session.post(endpoint, json=config)
+        response = self.session.post(self._url_account_initialize, json=config)
         response.raise_for_status()
         return response.json()
     
     def get_account_status(self) -> Dict[str, Any]:
         """Get current account status"""
-        endpoint = f"{self.base_url}/account/status"
-        response = self.session.get(endpoint)
+        response = self.session.get(self._url_account_status)
         response.raise_for_status()
         return response.json()
     
     def place_order(self, order_details: Dict[str, Any]) -> Dict[str, Any]:
         """Place a new order"""
-        endpoint = f"{self.base_url}/orders"
-        response = self.session.post(endpoint, json=order_details)
+        response = self.session.post(self._url_orders, json=order_details)
         response.raise_for_status()
         return response.json()
     
     def get_positions(self) -> Dict[str, Any]:
         """Get current positions"""
-        endpoint = f"{self.base_url}/positions"
-        response = self.session.get(endpoint)
+        response = self.session.get(self._url_positions)
         response.raise_for_status()
         return response.json()
     
     def get_orders(self) -> Dict[str, Any]:
         """Get order history"""
-        endpoint = f"{self.base_url}/orders"
-        response = self.session.get(endpoint)
+        response = self.session.get(self._url_orders)
         response.raise_for_status()
         return response.json()
     
     def get_market_data(self, symbols: list) -> Dict[str, Any]:
         """Get real-time market data for symbols"""
-        endpoint = f"{self.base_url}/market/data"
-        response = self.session.post(endpoint, json={'symbols': symbols})
+        response = self.session.post(self._url_market_data, json={'symbols': symbols})
         response.raise_for_status()
         return response.json()
 
 class FinMemManager:
     def __init__(self, config_path: str = None):
         self.config_path = config_path or "config/config.toml"
+        self._config_cache = None
+        Path(self.config_path).parent.mkdir(parents=True, exist_ok=True)
         self.config = self._load_config()
         self.simulation = None
         self.last_update = None
@@ -82,62 +116,25 @@ class FinMemManager:
         }
     
     def _load_config(self) -> Dict[str, Any]:
-        """Load FinMem configuration"""
+        """Load FinMem configuration, reusing the last load until the config is saved again"""
+        if self._config_cache is not None:
+            return self._config_cache
+        
         try:
             if os.path.exists(self.config_path):
-                return load_config(self.config_path)
+                self._config_cache = load_config(self.config_path)
             else:
                 # Return default config if file doesn't exist
-                return {
-                    "market": {
-                        "data_path": "data/market",
-                        "symbols": []
-                    },
-                    "trading": {
-                        "initial_capital": 100000,
-                        "position_size_limit": 0.2
-                    },
-                    "agent": {
-                        "model": "gpt-4",
-                        "risk_profile": "moderate"
-                    },
-                    "chat": {
-                        "system_prompt": "You are an expert Indian stock market trader.",
-                        "max_tokens": 500
-                    },
-                    "memory": {
-                        "max_days": 30
-                    }
-                }
+                self._config_cache = copy.deepcopy(DEFAULT_CONFIG)
         except Exception as e:
             print(f"Error loading config: {str(e)}")
             # Return default config on error
-            return {
-                "market": {
-                    "data_path": "data/market",
-                    "symbols": []
-                },
-                "trading": {
-                    "initial_capital": 100000,
-                    "position_size_limit": 0.2
-                },
-                "agent": {
-                    "model": "gpt-4",
-                    "risk_profile": "moderate"
-                },
-                "chat": {
-                    "system_prompt": "You are an expert Indian stock market trader.",
-                    "max_tokens": 500
-                },
-                "memory": {
-                    "max_days": 30
-                }
-            }
+            self._config_cache = copy.deepcopy(DEFAULT_CONFIG)
+        return self._config_cache
     
     def _save_config(self):
         """Save current configuration"""
         try:
-            Path(self.config_path).parent.mkdir(exist_ok=True)
             config_dict = {
                 "market": {
                     "data_path": "data/market",
@@ -160,8 +157,14 @@ class FinMemManager:
                 }
             }
             
-            with open(self.config_path, "w") as f:
+            # Write a temp file and swap it in, so a crash never leaves a truncated config
+            tmp_path = f"{self.config_path}.tmp"
+            with open(tmp_path, "w") as f:
                 toml.dump(config_dict, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.config_path)
+            self._config_cache = None
         except Exception as e:
             print(f"Error saving config: {str(e)}")
     
@@ -1,16 +1,16 @@
 from datetime import datetime, time, timedelta
-import pytz
+from zoneinfo import ZoneInfo
 
 class MarketHours:
     def __init__(self):
-        self.ist_tz = pytz.timezone('Asia/Kolkata')
+        self.ist_tz = ZoneInfo('Asia/Kolkata')
         self.market_open_time = time(9, 15)  # 9:15 AM IST
         self.market_close_time = time(15, 30)  # 3:30 PM IST
         self.pre_market_start = time(9, 0)  # 9:00 AM IST
         self.post_market_end = time(15, 45)  # 3:45 PM IST
         
         # Market holidays 2024 (update yearly)
-        self.holidays = [
+        holidays = [
             "2024-01-26",  # Republic Day
             "2024-03-08",  # Mahashivratri
             "2024-03-25",  # Holi
@@ -26,6 +26,8 @@ class MarketHours:
             "2024-11-15",  # Gurunanak Jayanti
             "2024-12-25",  # Christmas
         ]
+        # Parsed once so holiday checks are a set lookup on date objects
+        self.holidays = frozenset(datetime.strptime(day, "%Y-%m-%d").date() for day in holidays)
     
     def get_current_ist_time(self):
         """Get current time in IST"""
@@ -33,9 +35,7 @@ class MarketHours:
     
     def is_market_holiday(self, date=None):
         """Check if given date is a market holiday"""
-        if date is None:
-            date = self.get_current_ist_time().date()
-        return date.strftime("%Y-%m-%d") in self.holidays
+        return (date or self.get_current_ist_time().date()) in self.holidays
     
     def is_weekend(self, date=None):
         """Check if given date is a weekend"""
@@ -43,64 +43,60 @@ class MarketHours:
             date = self.get_current_ist_time().date()
         return date.weekday() >= 5  # Saturday = 5, Sunday = 6
     
-    def is_market_open(self):
-        """Check if market is currently open"""
-        current_time = self.get_current_ist_time()
+    def _is_trading_day(self, date):
+        """Check if the exchange trades on the given date"""
+        return date.weekday() < 5 and date not in self.holidays
+    
+    def _is_market_open_at(self, dt):
+        """Check if market is open at the given IST datetime"""
+        return self._is_trading_day(dt.date()) and self.market_open_time <= dt.time() < self.market_close_time
+    
+    def _is_pre_market_at(self, dt):
+        """Check if the given IST datetime falls in pre-market hours"""
+        return self._is_trading_day(dt.date()) and self.pre_market_start <= dt.time() < self.market_open_time
+    
+    def _is_post_market_at(self, dt):
+        """Check if the given IST datetime falls in post-market hours"""
+        return self._is_trading_day(dt.date()) and self.market_close_time <= dt.time() <= self.post_market_end
+    
+    def _next_market_open_at(self, dt):
+        """Get the next market opening time after the given IST datetime"""
+        next_day = dt.date()
         
-        # Check for weekends and holidays
-        if self.is_weekend() or self.is_market_holiday():
-            return False
+        # If after market close, start checking from next day
+        if dt.time() >= self.market_close_time:
+            next_day += timedelta(days=1)
         
-        current_time_obj = current_time.time()
-        return self.market_open_time <= current_time_obj < self.market_close_time
+        # Find next trading day
+        while not self._is_trading_day(next_day):
+            next_day += timedelta(days=1)
+        
+        return datetime.combine(next_day, self.market_open_time, tzinfo=self.ist_tz)
+    
+    def is_market_open(self):
+        """Check if market is currently open"""
+        return self._is_market_open_at(self.get_current_ist_time())
     
     def is_pre_market(self):
         """Check if currently in pre-market hours"""
-        current_time = self.get_current_ist_time()
-        
-        if self.is_weekend() or self.is_market_holiday():
-            return False
-        
-        current_time_obj = current_time.time()
-        return self.pre_market_start <= current_time_obj < self.market_open_time
+        return self._is_pre_market_at(self.get_current_ist_time())
     
     def is_post_market(self):
         """Check if currently in post-market hours"""
-        current_time = self.get_current_ist_time()
-        
-        if self.is_weekend() or self.is_market_holiday():
-            return False
-        
-        current_time_obj = current_time.time()
-        return self.market_close_time <= current_time_obj <= self.post_market_end
+        return self._is_post_market_at(self.get_current_ist_time())
     
     def get_next_market_open(self):
         """Get next market opening time"""
-        current_time = self.get_current_ist_time()
-        next_day = current_time
-        
-        # If after market close, start checking from next day
-        if current_time.time() >= self.market_close_time:
-            next_day += timedelta(days=1)
-        
-        # Find next trading day
-        while self.is_weekend(next_day.date()) or self.is_market_holiday(next_day.date()):
-            next_day += timedelta(days=1)
-        
-        return datetime.combine(
-            next_day.date(),
-            self.market_open_time
-        ).replace(tzinfo=self.ist_tz)
+        return self._next_market_open_at(self.get_current_ist_time())
     
-    def get_market_status(self):
-        """Get detailed market status"""
-        current_time = self.get_current_ist_time()
+    def get_market_status(self, now=None):
+        """Get detailed market status, optionally as of a given IST datetime"""
+        # Read the clock once and evaluate every check against it
+        current_time = now or self.get_current_ist_time()
+        today = current_time.date()
         
-        if self.is_market_open():
-            time_to_close = datetime.combine(
-                current_time.date(),
-                self.market_close_time
-            ).replace(tzinfo=self.ist_tz) - current_time
+        if self._is_market_open_at(current_time):
+            time_to_close = datetime.combine(today, self.market_close_time, tzinfo=self.ist_tz) - current_time
             
             return {
                 'status': 'OPEN',
@@ -109,11 +105,8 @@ class MarketHours:
                 'next_event_time': self.market_close_time.strftime('%H:%M')
             }
         
-        elif self.is_pre_market():
-            time_to_open = datetime.combine(
-                current_time.date(),
-                self.market_open_time
-            ).replace(tzinfo=self.ist_tz) - current_time
+        elif self._is_pre_market_at(current_time):
+            time_to_open = datetime.combine(today, self.market_open_time, tzinfo=self.ist_tz) - current_time
             
             return {
                 'status': 'PRE-MARKET',
@@ -122,8 +115,8 @@ class MarketHours:
                 'next_event_time': self.market_open_time.strftime('%H:%M')
             }
         
-        elif self.is_post_market():
-            next_open = self.get_next_market_open()
+        elif self._is_post_market_at(current_time):
+            next_open = self._next_market_open_at(current_time)
             
             return {
                 'status': 'POST-MARKET',
@@ -133,11 +126,11 @@ class MarketHours:
             }
         
         else:
-            next_open = self.get_next_market_open()
+            next_open = self._next_market_open_at(current_time)
             
-            if self.is_weekend():
+            if today.weekday() >= 5:
                 reason = "Weekend"
-            elif self.is_market_holiday():
+            elif today in self.holidays:
                 reason = "Market Holiday"
             else:
                 reason = "After Hours"
@@ -147,4 +140,4 @@ class MarketHours:
                 'message': f'Market closed ({reason}). Opens {next_open.strftime("%Y-%m-%d %H:%M")}',
                 'next_event': 'open',
                 'next_event_time': next_open.strftime('%Y-%m-%d %H:%M')
-            } 
\ No newline at end of file
+            }
\ No newline at end of file
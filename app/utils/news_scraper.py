@@ -1,506 +1,555 @@
-import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve as sv
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Mapping, Tuple
+from dataclasses import dataclass
 import time
 import random
+import re
 import threading
 import queue
+import asyncio
+import aiohttp
+from collections import deque, Counter
+from itertools import islice
+from aiohttp_client_cache import CachedSession, SQLiteBackend
+from contextlib import asynccontextmanager
+from yarl import URL
+from pathlib import Path
+from types import MappingProxyType
+from urllib.parse import urljoin
 from .market_hours import MarketHours
 
+# Request headers for sources that expect a regular browser
+BROWSER_HEADERS = MappingProxyType({
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+    "Connection": "keep-alive"
+})
+
+# News categories in priority order, with the keywords that mark each one
+NEWS_CATEGORIES = (
+    ('Earnings', ('earnings', 'revenue', 'profit', 'loss', 'quarterly', 'financial results')),
+    ('Corporate Action', ('dividend', 'bonus', 'split', 'merger', 'acquisition')),
+    ('Management', ('appoints', 'resigns', 'board', 'director', 'ceo', 'management')),
+    ('Regulatory', ('sebi', 'rbi', 'regulation', 'compliance', 'penalty')),
+    ('Market Update', ('stock', 'share', 'market', 'trading', 'price')),
+    ('Business Update', ('launches', 'expansion', 'contract', 'partnership', 'deal'))
+)
+
+# One anchored alternative per category, each a lookahead over the whole text, so a single
+# match() returns the highest-priority category with a keyword anywhere in the text
+_CATEGORY_GROUPS = {f'c{i}': i for i in range(len(NEWS_CATEGORIES))}
+_CATEGORY_RE = re.compile(
+    '|'.join(
+        f'(?=.*?(?:{"|".join(map(re.escape, keywords))}))(?P<c{i}>)'
+        for i, (_, keywords) in enumerate(NEWS_CATEGORIES)
+    ),
+    re.IGNORECASE | re.DOTALL
+)
+
+def _categorize_news(*texts: str) -> str:
+    """Categorize news based on content, taking the highest-priority category found in any of the texts"""
+    best = len(NEWS_CATEGORIES)
+    for text in texts:
+        match = _CATEGORY_RE.match(text)
+        if match:
+            best = min(best, _CATEGORY_GROUPS[match.lastgroup])
+            if best == 0:
+                break
+    return NEWS_CATEGORIES[best][0] if best < len(NEWS_CATEGORIES) else 'General'
+
+# Restrict each page parse to the article containers its parser reads
+_STRAINERS = {
+    'mc_latest': SoupStrainer('li', class_='clearfix'),
+    'mc_search': SoupStrainer('div', class_='search_result'),
+    'mc_stock': SoupStrainer(class_=['content_block', 'article_box', 'MT15', 'common-article']),
+    'mc_thread': SoupStrainer(class_='content_block'),
+    'et': SoupStrainer(class_=['eachStory', 'story_list', 'newslist']),
+    'et_tracking': SoupStrainer('div', attrs={'data-tracking-name': 'Story_List'}),
+    'bs': SoupStrainer(class_=['article', 'story-card', 'news-item', 'searchNews'])
+}
+
+# Fallback selector chains compiled once as CSS unions; each returns the first match in document order
+_MC_TITLE = sv.compile('.content_headline a, h2 a, .article_title, a[class*="title"]')
+_MC_SUMMARY = sv.compile('.content_text, .article_desc, p')
+_MC_HEADLINE = sv.compile('.content_headline a')
+_MC_TEXT = sv.compile('.content_text')
+_BS_TITLE = sv.compile('.headline, h2, .article-title, a[class*="title"]')
+_BS_SUMMARY = sv.compile('.summary, .description, .article-desc, p')
+_ET_TITLE = sv.compile('.title, h3, .story_title, a[data-tracking-name="Story_Title"]')
+_ET_SUMMARY = sv.compile('.summary, .desc, .story_desc, p')
+_LINK = sv.compile('a')
+
+@dataclass
+class SourceHealth:
+    """Consecutive request failures for a host, when its circuit opened, and whether a trial request is out"""
+    fail_count: int = 0
+    opened_at: Optional[float] = None
+    trial: bool = False
+
+class CircuitOpen(aiohttp.ClientError):
+    """Raised instead of requesting a host whose circuit is open"""
+
+class RequestLimiter:
+    """Caps outstanding HTTP requests, both overall and per host, and breaks the circuit to failing hosts
+    
+    After max_failures consecutive failures a host is skipped for cooldown seconds. After that a
+    single trial request goes through while other requests to the host are still skipped; its
+    success closes the circuit and its failure reopens it for another cooldown.
+    """
+    
+    def __init__(self, total: int = 15, per_host: int = 5, max_failures: int = 3, cooldown: float = 60):
+        self.total = asyncio.Semaphore(total)
+        self.per_host = per_host
+        self.hosts: Dict[str, asyncio.Semaphore] = {}
+        self.max_failures = max_failures
+        self.cooldown = cooldown
+        self.health: Dict[str, SourceHealth] = {}
+    
+    @asynccontextmanager
+    async def limit(self, url: str):
+        """Hold a global and a per-host slot for the duration of a request"""
+        host = URL(url).host
+        health = self.health.get(host)
+        if health is None:
+            health = self.health[host] = SourceHealth()
+        
+        # Half-open: once the cooldown is over, let exactly one request through as a trial
+        trial = health.opened_at is not None
+        if trial:
+            if health.trial or time.monotonic() - health.opened_at < self.cooldown:
+                raise CircuitOpen(f"Circuit open for {host}")
+            health.trial = True
+        
+        host_sem = self.hosts.get(host)
+        if host_sem is None:
+            host_sem = self.hosts[host] = asyncio.Semaphore(self.per_host)
+        
+        try:
+            async with self.total, host_sem:
+                try:
+                    yield
+                except (aiohttp.ClientError, asyncio.TimeoutError):
+                    health.fail_count += 1
+                    if trial or health.fail_count >= self.max_failures:
+                        health.opened_at = time.monotonic()
+                    raise
+                else:
+                    health.fail_count = 0
+                    health.opened_at = None
+        finally:
+            if trial:
+                health.trial = False
+
+# A fetched page: its raw body and the charset the response declared, if any
+Page = Tuple[bytes, Optional[str]]
+
+async def _fetch_page(session: aiohttp.ClientSession, limiter: RequestLimiter, url: str,
+                      attempts: int = 2, **kwargs) -> Page:
+    """GET a page through the limiter, retrying transient client errors and timeouts with exponential backoff
+    
+    All attempts share one limiter scope, so a fetch that fails every attempt counts as a single
+    failure towards the host's circuit breaker. The body is returned undecoded; lxml decodes it
+    in C while parsing.
+    """
+    async with limiter.limit(url):
+        for attempt in range(attempts):
+            try:
+                async with session.get(url, **kwargs) as response:
+                    return await response.read(), response.charset
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if attempt == attempts - 1:
+                    raise
+                await asyncio.sleep(min(2 ** attempt, 8))  # Exponential backoff
+
+def _make_soup(page: Page, strainer: SoupStrainer) -> BeautifulSoup:
+    """Parse a fetched page with lxml, decoding with its declared charset or sniffing one"""
+    raw, encoding = page
+    return BeautifulSoup(raw, 'lxml', parse_only=strainer, from_encoding=encoding)
+
 class MoneyControlNewsScraper:
-    def __init__(self):
-        self.base_url = "https://www.moneycontrol.com"
-        self.headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5",
-            "Connection": "keep-alive"
-        }
-    
-    def get_latest_news(self, pages: int = 1) -> List[Dict[str, Any]]:
+    BASE_URL = "https://www.moneycontrol.com"
+    HEADERS = BROWSER_HEADERS
+    
+    def __init__(self, session: aiohttp.ClientSession = None, limiter: RequestLimiter = None):
+        self.session = session  # Shared aiohttp session, owned by NewsAggregator
+        self.limiter = limiter  # Shared request limiter, owned by NewsAggregator
+    
+    async def _fetch(self, url: str, timeout: float = 10, refresh: bool = False) -> Page:
+        """Fetch a page's HTML over the shared session; refresh revalidates any cached copy"""
+        # Always bounded: a hung request would hold its limiter slots indefinitely
+        return await _fetch_page(self.session, self.limiter, url, headers=self.HEADERS,
+                                 timeout=aiohttp.ClientTimeout(total=timeout), refresh=refresh)
+    
+    async def _parse(self, parser, *args) -> List[Dict[str, Any]]:
+        """Run a page parser off the event loop so BeautifulSoup doesn't stall other scrapes"""
+        return await asyncio.get_running_loop().run_in_executor(None, parser, *args)
+    
+    async def get_latest_news(self, pages: int = 1) -> List[Dict[str, Any]]:
         """Get latest market news from MoneyControl"""
         news_list = []
         
         try:
             for page in range(1, pages + 1):
-                url = f"{self.base_url}/news/business/page-{page}"
-                response = requests.get(url, headers=self.headers)
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Find news articles
-                articles = soup.find_all('li', class_='clearfix')
-                
-                for article in articles:
-                    try:
-                        title_elem = article.find('h2')
-                        if not title_elem:
-                            continue
-                            
-                        title = title_elem.text.strip()
-                        link = title_elem.find('a')['href'] if title_elem.find('a') else None
-                        
-                        # Get article timestamp
-                        time_elem = article.find('span', class_='date')
-                        timestamp = time_elem.text.strip() if time_elem else None
-                        
-                        # Get article summary
-                        summary = article.find('p')
-                        summary = summary.text.strip() if summary else None
-                        
-                        if title and link:
-                            news_list.append({
-                                'title': title,
-                                'link': link,
-                                'timestamp': timestamp,
-                                'summary': summary
-                            })
-                    
-                    except Exception as e:
-                        print(f"Error processing article: {str(e)}")
-                        continue
+                url = f"{self.BASE_URL}/news/business/page-{page}"
+                listing = await self._fetch(url)
+                news_list.extend(await self._parse(self._parse_listing, listing, 'li', 'h2'))
                 
                 # Add delay between pages
                 if page < pages:
-                    time.sleep(random.uniform(1, 3))
+                    await asyncio.sleep(random.uniform(1, 3))
         
         except Exception as e:
             print(f"Error fetching news: {str(e)}")
         
         return news_list
     
-    def get_stock_news(self, symbol: str) -> List[Dict[str, Any]]:
-        """Get news for a specific stock from MoneyControl"""
-        news_items = []
-        try:
-            # Try different URL formats
-            urls = [
-                f"{self.base_url}/stocks/company_info/stock_news.php?sc_id={symbol}",
-                f"{self.base_url}/company-article/{symbol}/news/",
-                f"{self.base_url}/news/tags/{symbol.lower()}/",
-            ]
-            
-            for url in urls:
-                try:
-                    response = requests.get(url, headers=self.headers, timeout=10)
-                    soup = BeautifulSoup(response.text, 'html.parser')
-                    
-                    # Try different article selectors
-                    selectors = [
-                        '.content_block',  # Main news container
-                        '.article_box',    # Alternative container
-                        '.MT15',           # Another possible container
-                        '.common-article'  # Generic article container
-                    ]
-                    
-                    for selector in selectors:
-                        articles = soup.select(selector)
-                        if articles:
-                            for article in articles:
-                                try:
-                                    # Extract title
-                                    title_elem = (
-                                        article.select_one('.content_headline a') or
-                                        article.select_one('h2 a') or
-                                        article.select_one('.article_title') or
-                                        article.select_one('a[class*="title"]')
-                                    )
-                                    
-                                    if not title_elem:
-                                        continue
-                                    
-                                    title = title_elem.get_text(strip=True)
-                                    
-                                    # Extract summary
-                                    summary_elem = (
-                                        article.select_one('.content_text') or
-                                        article.select_one('.article_desc') or
-                                        article.select_one('p')
-                                    )
-                                    
-                                    summary = summary_elem.get_text(strip=True) if summary_elem else "No summary available"
-                                    
-                                    # Extract link
-                                    link = title_elem.get('href', '')
-                                    if link and not link.startswith('http'):
-                                        link = self.base_url + link
-                                    
-                                    # Add news item
-                                    news_items.append({
-                                        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                                        'source': 'MoneyControl',
-                                        'symbol': symbol,
-                                        'title': title,
-                                        'summary': summary,
-                                        'link': link,
-                                        'type': self._categorize_news(title + " " + summary)
-                                    })
-                                
-                                except Exception as e:
-                                    print(f"Error parsing article for {symbol}: {str(e)}")
-                                    continue
-                            
-                            if news_items:  # If we found news items, break the selector loop
-                                break
+    def _parse_listing(self, page: Page, container: str, title_tag: str) -> List[Dict[str, Any]]:
+        """Extract title/link/timestamp/summary from a MoneyControl article listing"""
+        news_list = []
+        strainer = _STRAINERS['mc_latest'] if container == 'li' else _STRAINERS['mc_search']
+        soup = _make_soup(page, strainer)
+        
+        # Find news articles
+        container_class = 'clearfix' if container == 'li' else 'search_result'
+        articles = soup.find_all(container, class_=container_class)
+        
+        for article in articles:
+            try:
+                title_elem = article.find(title_tag)
+                if not title_elem:
+                    continue
                     
-                    if news_items:  # If we found news items, break the URL loop
-                        break
+                title = title_elem.text.strip()
+                link = title_elem.find('a')['href'] if title_elem.find('a') else None
                 
-                except requests.RequestException as e:
-                    print(f"Error fetching URL {url}: {str(e)}")
-                    continue
+                # Get article timestamp
+                time_elem = article.find('span', class_='date')
+                timestamp = time_elem.text.strip() if time_elem else None
+                
+                # Get article summary
+                summary = article.find('p')
+                summary = summary.text.strip() if summary else None
+                
+                if title and link:
+                    news_list.append({
+                        'title': title,
+                        'link': link,
+                        'timestamp': timestamp,
+                        'summary': summary
+                    })
+            
+            except Exception as e:
+                print(f"Error processing article: {str(e)}")
+                continue
+        
+        return news_list
+    
+    async def get_stock_news(self, symbol: str, force_refresh: bool = False) -> List[Dict[str, Any]]:
+        """Get news for a specific stock from MoneyControl
+        
+        Pages come from the response cache while fresh; force_refresh revalidates them with the server.
+        """
+        # Try different URL formats at once; the first one that yields news wins
+        urls = [
+            f"{self.BASE_URL}/stocks/company_info/stock_news.php?sc_id={symbol}",
+            f"{self.BASE_URL}/company-article/{symbol}/news/",
+            f"{self.BASE_URL}/news/tags/{symbol.lower()}/",
+        ]
+        tasks = [asyncio.create_task(self._try_url(url, symbol, force_refresh)) for url in urls]
+        
+        try:
+            for task in asyncio.as_completed(tasks):
+                news_items = await task
+                if news_items:
+                    return news_items
         
         except Exception as e:
             print(f"Error scraping news for {symbol}: {str(e)}")
         
-        return news_items
-    
-    def search_news(self, query: str, pages: int = 1) -> List[Dict[str, Any]]:
-        """Search news articles by keyword"""
-        news_list = []
+        finally:
+            for task in tasks:
+                task.cancel()
         
+        return []
+    
+    async def _try_url(self, url: str, symbol: str, force_refresh: bool) -> List[Dict[str, Any]]:
+        """Fetch and parse one candidate stock news URL"""
         try:
-            for page in range(1, pages + 1):
-                url = f"{self.base_url}/news/searchresult.php?q={query}&page={page}"
-                response = requests.get(url, headers=self.headers)
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Find news articles
-                articles = soup.find_all('div', class_='search_result')
-                
+            page = await self._fetch(url, timeout=10, refresh=force_refresh)
+            return await self._parse(self._parse_stock_news, page, symbol)
+        
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Error fetching URL {url}: {str(e)}")
+            return []
+    
+    def _parse_stock_news(self, page: Page, symbol: str) -> List[Dict[str, Any]]:
+        """Extract news items from a MoneyControl stock news page"""
+        news_items = []
+        soup = _make_soup(page, _STRAINERS['mc_stock'])
+        scraped_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')  # One timestamp for the whole page
+        
+        # Try different article selectors
+        selectors = [
+            '.content_block',  # Main news container
+            '.article_box',    # Alternative container
+            '.MT15',           # Another possible container
+            '.common-article'  # Generic article container
+        ]
+        
+        for selector in selectors:
+            articles = soup.select(selector)
+            if articles:
                 for article in articles:
                     try:
-                        title_elem = article.find('h3')
+                        # Extract title
+                        title_elem = _MC_TITLE.select_one(article)
+                        
                         if not title_elem:
                             continue
-                            
-                        title = title_elem.text.strip()
-                        link = title_elem.find('a')['href'] if title_elem.find('a') else None
                         
-                        # Get article timestamp
-                        time_elem = article.find('span', class_='date')
-                        timestamp = time_elem.text.strip() if time_elem else None
+                        title = title_elem.get_text(strip=True)
+                        
+                        # Extract summary
+                        summary_elem = _MC_SUMMARY.select_one(article)
+                        
+                        summary = summary_elem.get_text(strip=True) if summary_elem else "No summary available"
                         
-                        # Get article summary
-                        summary = article.find('p')
-                        summary = summary.text.strip() if summary else None
+                        # Extract link
+                        link = title_elem.get('href', '')
+                        if link:
+                            link = urljoin(self.BASE_URL, link)
                         
-                        if title and link:
-                            news_list.append({
-                                'title': title,
-                                'link': link,
-                                'timestamp': timestamp,
-                                'summary': summary
-                            })
+                        # Add news item
+                        news_items.append({
+                            'timestamp': scraped_at,
+                            'source': 'MoneyControl',
+                            'symbol': symbol,
+                            'title': title,
+                            'summary': summary,
+                            'link': link,
+                            'type': _categorize_news(title, summary)
+                        })
                     
                     except Exception as e:
-                        print(f"Error processing article: {str(e)}")
+                        print(f"Error parsing article for {symbol}: {str(e)}")
                         continue
                 
+                if news_items:  # If we found news items, break the selector loop
+                    break
+        
+        return news_items
+    
+    async def search_news(self, query: str, pages: int = 1) -> List[Dict[str, Any]]:
+        """Search news articles by keyword"""
+        news_list = []
+        
+        try:
+            for page in range(1, pages + 1):
+                url = f"{self.BASE_URL}/news/searchresult.php?q={query}&page={page}"
+                listing = await self._fetch(url)
+                news_list.extend(await self._parse(self._parse_listing, listing, 'div', 'h3'))
+                
                 # Add delay between pages
                 if page < pages:
-                    time.sleep(random.uniform(1, 3))
+                    await asyncio.sleep(random.uniform(1, 3))
         
         except Exception as e:
             print(f"Error searching news: {str(e)}")
         
         return news_list
+
+class SymbolNewsScraper:
+    """Scrapes one symbol's news sources; run as a task on NewsAggregator's event loop"""
+    
+    MONEYCONTROL_HEADERS = MappingProxyType({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    })
+    BUSINESS_STANDARD_HEADERS = BROWSER_HEADERS
+    
+    def __init__(self, symbol: str, news_queue: queue.Queue, session: aiohttp.ClientSession,
+                 limiter: RequestLimiter):
+        self.symbol = symbol
+        self.news_queue = news_queue
+        self.session = session  # Shared aiohttp session, owned by NewsAggregator
+        self.limiter = limiter  # Shared request limiter, owned by NewsAggregator
     
-    def _categorize_news(self, text: str) -> str:
-        """Categorize news based on content"""
-        text = text.lower()
+    async def scrape(self):
+        """Scrape the symbol's sources concurrently and queue what they find
         
-        categories = {
-            'Earnings': ['earnings', 'revenue', 'profit', 'loss', 'quarterly', 'financial results'],
-            'Corporate Action': ['dividend', 'bonus', 'split', 'merger', 'acquisition'],
-            'Management': ['appoints', 'resigns', 'board', 'director', 'ceo', 'management'],
-            'Regulatory': ['sebi', 'rbi', 'regulation', 'compliance', 'penalty'],
-            'Market Update': ['stock', 'share', 'market', 'trading', 'price'],
-            'Business Update': ['launches', 'expansion', 'contract', 'partnership', 'deal']
-        }
+        Economic Times is scraped once for all symbols by NewsAggregator.
+        """
+        session = self.session
+        results = await asyncio.gather(
+            self._scrape_moneycontrol(session),
+            self._scrape_business_standard(session),
+            return_exceptions=True
+        )
         
-        for category, keywords in categories.items():
-            if any(keyword in text for keyword in keywords):
-                return category
+        news_items = []
+        for result in results:
+            if isinstance(result, Exception):
+                print(f"Error scraping news for {self.symbol}: {str(result)}")
+            else:
+                news_items.extend(result)
         
-        return 'General'
-
-class NewsScraperThread(threading.Thread):
-    def __init__(self, symbol: str, news_queue: queue.Queue):
-        super().__init__()
-        self.symbol = symbol
-        self.news_queue = news_queue
-        self.running = True
-        self.daemon = True  # Thread will exit when main program exits
+        # Add news items to queue as one batch
+        if news_items:
+            self.news_queue.put([{'symbol': self.symbol, 'news': item} for item in news_items])
     
-    def run(self):
-        """Run news scraping for the assigned symbol"""
-        while self.running:
-            try:
-                # Scrape from multiple sources
-                news_items = []
-                news_items.extend(self._scrape_moneycontrol())
-                news_items.extend(self._scrape_economic_times())
-                news_items.extend(self._scrape_business_standard())
-                
-                # Add news items to queue
-                for item in news_items:
-                    self.news_queue.put({
-                        'symbol': self.symbol,
-                        'news': item
-                    })
-                
-                # Sleep between scrapes
-                time.sleep(60)  # 1 minute delay between scrapes
-                
-            except Exception as e:
-                print(f"Error scraping news for {self.symbol}: {str(e)}")
-                time.sleep(60)  # Wait before retrying
+    async def _fetch(self, session: aiohttp.ClientSession, url: str, headers: Mapping[str, str]) -> Page:
+        """Fetch a page's HTML"""
+        return await _fetch_page(session, self.limiter, url, headers=headers,
+                                 timeout=aiohttp.ClientTimeout(total=10))
+    
+    async def _parse(self, parser, page: Page, url: str) -> List[Dict[str, Any]]:
+        """Run a page parser off the event loop so BeautifulSoup doesn't stall the other fetches"""
+        return await asyncio.get_running_loop().run_in_executor(None, parser, page, url)
     
-    def _scrape_moneycontrol(self) -> List[Dict[str, Any]]:
+    async def _scrape_moneycontrol(self, session: aiohttp.ClientSession) -> List[Dict[str, Any]]:
         """Scrape news from MoneyControl"""
-        news_items = []
         try:
             # MoneyControl search URL
             url = f"https://www.moneycontrol.com/stocks/company_info/stock_news.php?sc_id={self.symbol}"
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            
-            response = requests.get(url, headers=headers)
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Extract news items
-            for article in soup.select('.content_block'):
-                try:
-                    news_items.append({
-                        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                        'source': 'MoneyControl',
-                        'title': article.select_one('.content_headline a').text.strip(),
-                        'summary': article.select_one('.content_text').text.strip(),
-                        'link': article.select_one('.content_headline a')['href'],
-                        'type': self._categorize_news(article.text)
-                    })
-                except Exception as e:
-                    print(f"Error parsing MoneyControl article: {str(e)}")
+            page = await self._fetch(session, url, self.MONEYCONTROL_HEADERS)
+            return await self._parse(self._parse_moneycontrol, page, url)
         
         except Exception as e:
             print(f"Error scraping MoneyControl: {str(e)}")
-        
-        return news_items
+            return []
     
-    def _scrape_economic_times(self) -> List[Dict[str, Any]]:
-        """Scrape news from Economic Times"""
+    def _parse_moneycontrol(self, page: Page, url: str) -> List[Dict[str, Any]]:
+        """Extract news items from a MoneyControl stock news page"""
         news_items = []
-        try:
-            # Economic Times search URL with the stock symbol
-            url = f"https://economictimes.indiatimes.com/markets/stocks/news"
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Connection': 'keep-alive',
-            }
-            
-            response = requests.get(url, headers=headers, timeout=10)
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Try different possible article selectors
-            articles = []
-            selectors = [
-                '.eachStory',  # Main article container
-                '.story_list',  # Alternative container
-                '.newslist',    # Another possible container
-                'div[data-tracking-name="Story_List"]'  # Data attribute based selector
-            ]
-            
-            for selector in selectors:
-                articles = soup.select(selector)
-                if articles:
-                    break
-            
-            # Extract news items related to the symbol
-            for article in articles:
-                try:
-                    # Try different title selectors
-                    title_elem = (
-                        article.select_one('.title') or 
-                        article.select_one('h3') or 
-                        article.select_one('.story_title') or
-                        article.select_one('a[data-tracking-name="Story_Title"]')
-                    )
-                    
-                    if not title_elem:
-                        continue
-                        
-                    title = title_elem.get_text(strip=True)
-                    
-                    # Only process if title contains the symbol
-                    if self.symbol.lower() in title.lower():
-                        # Try different summary selectors
-                        summary_elem = (
-                            article.select_one('.summary') or 
-                            article.select_one('.desc') or 
-                            article.select_one('.story_desc') or
-                            article.select_one('p')
-                        )
-                        
-                        summary = summary_elem.get_text(strip=True) if summary_elem else "No summary available"
-                        
-                        # Try different link selectors
-                        link_elem = (
-                            title_elem.get('href') or 
-                            article.select_one('a').get('href') if article.select_one('a') else None
-                        )
-                        
-                        if link_elem:
-                            # Make sure link is absolute
-                            if not link_elem.startswith('http'):
-                                link_elem = 'https://economictimes.indiatimes.com' + link_elem
-                        else:
-                            link_elem = url  # Use main URL if no specific link found
-                        
-                        news_items.append({
-                            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                            'source': 'Economic Times',
-                            'title': title,
-                            'summary': summary,
-                            'link': link_elem,
-                            'type': self._categorize_news(title + " " + summary)
-                        })
-                
-                except Exception as e:
-                    print(f"Error parsing individual Economic Times article: {str(e)}")
-                    continue
+        soup = _make_soup(page, _STRAINERS['mc_thread'])
+        scraped_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')  # One timestamp for the whole page
         
-        except requests.RequestException as e:
-            print(f"Network error scraping Economic Times: {str(e)}")
-        except Exception as e:
-            print(f"Error scraping Economic Times: {str(e)}")
+        # Extract news items
+        for article in soup.select('.content_block'):
+            try:
+                headline = _MC_HEADLINE.select_one(article)
+                news_items.append({
+                    'timestamp': scraped_at,
+                    'source': 'MoneyControl',
+                    'title': headline.text.strip(),
+                    'summary': _MC_TEXT.select_one(article).text.strip(),
+                    'link': urljoin(url, headline['href']),
+                    'type': _categorize_news(article.text)
+                })
+            except Exception as e:
+                print(f"Error parsing MoneyControl article: {str(e)}")
         
         return news_items
     
-    def _scrape_business_standard(self) -> List[Dict[str, Any]]:
+    async def _scrape_business_standard(self, session: aiohttp.ClientSession) -> List[Dict[str, Any]]:
         """Scrape news from Business Standard"""
-        news_items = []
         try:
             # Business Standard search URL
             url = f"https://www.business-standard.com/search?type=news&q={self.symbol}"
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Connection': 'keep-alive',
-            }
-            
-            response = requests.get(url, headers=headers, timeout=10)
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Try different article selectors
-            articles = []
-            selectors = [
-                '.article',
-                '.story-card',
-                '.news-item',
-                '.searchNews'
-            ]
-            
-            for selector in selectors:
-                articles = soup.select(selector)
-                if articles:
-                    break
-            
-            for article in articles:
-                try:
-                    # Try different title selectors
-                    title_elem = (
-                        article.select_one('.headline') or
-                        article.select_one('h2') or
-                        article.select_one('.article-title') or
-                        article.select_one('a[class*="title"]')
-                    )
-                    
-                    if not title_elem:
-                        continue
-                    
-                    title = title_elem.get_text(strip=True)
-                    
-                    # Try different summary selectors
-                    summary_elem = (
-                        article.select_one('.summary') or
-                        article.select_one('.description') or
-                        article.select_one('.article-desc') or
-                        article.select_one('p')
-                    )
-                    
-                    summary = summary_elem.get_text(strip=True) if summary_elem else "No summary available"
-                    
-                    # Try different link selectors
-                    link_elem = article.select_one('a')
-                    link = link_elem.get('href') if link_elem else None
-                    
-                    if link:
-                        # Make sure link is absolute
-                        if not link.startswith('http'):
-                            link = 'https://www.business-standard.com' + link
-                    else:
-                        link = url  # Use main URL if no specific link found
-                    
-                    news_items.append({
-                        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                        'source': 'Business Standard',
-                        'title': title,
-                        'summary': summary,
-                        'link': link,
-                        'type': self._categorize_news(title + " " + summary)
-                    })
-                
-                except Exception as e:
-                    print(f"Error parsing Business Standard article: {str(e)}")
-                    continue
+            page = await self._fetch(session, url, self.BUSINESS_STANDARD_HEADERS)
+            return await self._parse(self._parse_business_standard, page, url)
         
-        except requests.RequestException as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             print(f"Network error scraping Business Standard: {str(e)}")
         except Exception as e:
             print(f"Error scraping Business Standard: {str(e)}")
         
-        return news_items
+        return []
     
-    def _categorize_news(self, text: str) -> str:
-        """Categorize news based on content"""
-        text = text.lower()
+    def _parse_business_standard(self, page: Page, url: str) -> List[Dict[str, Any]]:
+        """Extract news items from a Business Standard search results page"""
+        news_items = []
+        soup = _make_soup(page, _STRAINERS['bs'])
+        scraped_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')  # One timestamp for the whole page
         
-        categories = {
-            'Earnings': ['earnings', 'revenue', 'profit', 'loss', 'quarterly', 'financial results'],
-            'Corporate Action': ['dividend', 'bonus', 'split', 'merger', 'acquisition'],
-            'Management': ['appoints', 'resigns', 'board', 'director', 'ceo', 'management'],
-            'Regulatory': ['sebi', 'rbi', 'regulation', 'compliance', 'penalty'],
-            'Market Update': ['stock', 'share', 'market', 'trading', 'price'],
-            'Business Update': ['launches', 'expansion', 'contract', 'partnership', 'deal']
-        }
+        # Try different article selectors
+        articles = []
+        selectors = [
+            '.article',
+            '.story-card',
+            '.news-item',
+            '.searchNews'
+        ]
         
-        for category, keywords in categories.items():
-            if any(keyword in text for keyword in keywords):
-                return category
+        for selector in selectors:
+            articles = soup.select(selector)
+            if articles:
+                break
         
-        return 'General'
-    
-    def stop(self):
-        """Stop the news scraping thread"""
-        self.running = False
+        for article in articles:
+            try:
+                # Try different title selectors
+                title_elem = _BS_TITLE.select_one(article)
+                
+                if not title_elem:
+                    continue
+                
+                title = title_elem.get_text(strip=True)
+                
+                # Try different summary selectors
+                summary_elem = _BS_SUMMARY.select_one(article)
+                
+                summary = summary_elem.get_text(strip=True) if summary_elem else "No summary available"
+                
+                # Try different link selectors
+                link_elem = _LINK.select_one(article)
+                link = link_elem.get('href') if link_elem else None
+                
+                if link:
+                    # Make sure link is absolute
+                    link = urljoin('https://www.business-standard.com', link)
+                else:
+                    link = url  # Use main URL if no specific link found
+                
+                news_items.append({
+                    'timestamp': scraped_at,
+                    'source': 'Business Standard',
+                    'title': title,
+                    'summary': summary,
+                    'link': link,
+                    'type': _categorize_news(title, summary)
+                })
+            
+            except Exception as e:
+                print(f"Error parsing Business Standard article: {str(e)}")
+                continue
+        
+        return news_items
 
 class NewsAggregator:
+    ECONOMIC_TIMES_HEADERS = BROWSER_HEADERS
+    
     def __init__(self, symbols: List[str]):
         self.symbols = symbols
         self.news_queue = queue.Queue()
         self.scrapers = {}
         self.market_hours = MarketHours()
         self.running = False
-        self.latest_news = []
         self.max_news = 100  # Maximum number of news items to keep
+        self.latest_news = deque(maxlen=self.max_news)  # Newest first; oldest items fall off the end
+        self._source_counts = Counter()  # Items per source in latest_news, for get_news_summary
+        self._symbol_counts = Counter()  # Items per symbol in latest_news
         self.moneycontrol = MoneyControlNewsScraper()  # Initialize MoneyControl scraper
         self.last_news_fetch = {}  # Track last fetch time for each symbol
         self.news_fetch_interval = timedelta(minutes=5)  # Fetch news every 5 minutes
+        self._loop = None  # Event loop shared by every scraper, run on its own thread
+        self._loop_thread = None
+        self._session = None  # One pooled, response-caching aiohttp session for all scrapers
+        self.cache_path = Path("data/news_cache.sqlite")
+        self.cache_expiry = 300  # Seconds a cached page is served without revalidation
+        self._limiter = None  # Bounds concurrent requests across all scrapers
+        self._scrape_tasks = []  # Per-symbol and Economic Times scrape loops on the shared loop
+        self.scrape_interval = 60  # Seconds between scrapes of each symbol's sources
+        self.economic_times_interval = 60  # Seconds between Economic Times scrapes
+        
+        # Matches any tracked symbol as a whole word; longest first so HDFCBANK wins over HDFC
+        self._symbol_pattern = re.compile(
+            r'\b(' + '|'.join(map(re.escape, sorted(symbols, key=len, reverse=True))) + r')\b',
+            re.IGNORECASE
+        ) if symbols else None
+        self._symbol_lookup = {symbol.lower(): symbol for symbol in symbols}
     
     def start(self):
         """Start news aggregation for all symbols"""
@@ -509,12 +558,21 @@ class NewsAggregator:
         
         self.running = True
         
-        # Start scraper threads for each symbol
+        # Start the shared event loop and open the pooled session on it
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self._loop.run_forever)
+        self._loop_thread.daemon = True
+        self._loop_thread.start()
+        self._session = self._run(self._open_session())
+        self._limiter = RequestLimiter(total=15, per_host=5)
+        self.moneycontrol.session = self._session
+        self.moneycontrol.limiter = self._limiter
+        
+        # One scraper per symbol, all driven as tasks on the shared loop
         for symbol in self.symbols:
-            scraper = NewsScraperThread(symbol, self.news_queue)
-            self.scrapers[symbol] = scraper
-            scraper.start()
+            self.scrapers[symbol] = SymbolNewsScraper(symbol, self.news_queue, self._session, self._limiter)
             self.last_news_fetch[symbol] = datetime.min  # Initialize last fetch time
+        self._run(self._start_scraping())
         
         # Start news processing thread
         self.processor_thread = threading.Thread(target=self._process_news)
@@ -524,83 +582,280 @@ class NewsAggregator:
         # Initial news fetch for all symbols
         self._fetch_all_news()
     
+    def stop(self):
+        """Stop news aggregation and release the shared session"""
+        if not self.running:
+            return
+        
+        self.running = False
+        self.news_queue.put(None)  # Wake the processor thread so it can exit
+        
+        try:
+            self._run(self._close_session())
+        except Exception as e:
+            print(f"Error closing news session: {str(e)}")
+        
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join(timeout=1)
+    
+    def _run(self, coro):
+        """Run a coroutine on the shared event loop and wait for its result"""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+    
+    async def _open_session(self) -> aiohttp.ClientSession:
+        """Create the pooled session; it must be created on the loop that will use it
+        
+        Responses are cached on disk by URL, so pages shared across symbols or refetched
+        before they change cost one real round-trip; Cache-Control/ETag headers drive revalidation.
+        """
+        self.cache_path.parent.mkdir(exist_ok=True)
+        cache = SQLiteBackend(
+            str(self.cache_path),
+            expire_after=self.cache_expiry,
+            allowed_codes=(200,),
+            allowed_methods=('GET',),
+            cache_control=True
+        )
+        connector = aiohttp.TCPConnector(limit=30, limit_per_host=5, ttl_dns_cache=300, keepalive_timeout=60)
+        return CachedSession(cache=cache, connector=connector, headers=MoneyControlNewsScraper.HEADERS)
+    
+    async def _close_session(self):
+        """Cancel the scrape loops, then close the pooled session"""
+        for task in self._scrape_tasks:
+            task.cancel()
+        await asyncio.gather(*self._scrape_tasks, return_exceptions=True)
+        self._scrape_tasks = []
+        
+        if self._session:
+            await self._session.close()
+            self._session = None
+    
+    async def _start_scraping(self):
+        """Start a scrape loop per symbol plus the shared Economic Times and MoneyControl refresh loops"""
+        self._scrape_tasks = [
+            asyncio.create_task(self._symbol_cycle(scraper)) for scraper in self.scrapers.values()
+        ]
+        
+        # Scrape the Economic Times landing page once per interval for every symbol
+        self._scrape_tasks.append(asyncio.create_task(self._economic_times_cycle()))
+        
+        # Refresh MoneyControl stock news on its own timer, apart from the queue drain
+        self._scrape_tasks.append(asyncio.create_task(self._refresh_cycle()))
+    
+    async def _symbol_cycle(self, scraper: SymbolNewsScraper):
+        """Scrape one symbol's sources once per interval"""
+        while self.running:
+            try:
+                await scraper.scrape()
+            except Exception as e:
+                print(f"Error scraping news for {scraper.symbol}: {str(e)}")
+            
+            await asyncio.sleep(self.scrape_interval)
+    
+    async def _economic_times_cycle(self):
+        """Fetch and parse the Economic Times page once, then queue each article for every symbol it names"""
+        while self.running:
+            try:
+                batch = [
+                    {'symbol': symbol, 'news': item}
+                    for item, symbols in await self._scrape_economic_times()
+                    for symbol in symbols
+                ]
+                if batch:
+                    self.news_queue.put(batch)
+            except Exception as e:
+                print(f"Error scraping Economic Times: {str(e)}")
+            
+            await asyncio.sleep(self.economic_times_interval)
+    
+    def _match_symbols(self, title: str) -> set:
+        """Get the tracked symbols mentioned in a headline
+        
+        Symbols match as whole words, case-insensitively. The per-symbol scrapers this replaced
+        used a plain substring test, which tagged e.g. LT on every headline containing "result";
+        a symbol glued to other letters (say "TCSshares") no longer counts as a mention.
+        """
+        if not self._symbol_pattern:
+            return set()
+        return {self._symbol_lookup[match.lower()] for match in self._symbol_pattern.findall(title)}
+    
+    async def _scrape_economic_times(self) -> List[Tuple[Dict[str, Any], set]]:
+        """Scrape the Economic Times stock news page once for all symbols"""
+        try:
+            # Economic Times stock news landing page, shared by all symbols
+            url = f"https://economictimes.indiatimes.com/markets/stocks/news"
+            page = await _fetch_page(self._session, self._limiter, url, headers=self.ECONOMIC_TIMES_HEADERS,
+                                     timeout=aiohttp.ClientTimeout(total=10))
+            return await asyncio.get_running_loop().run_in_executor(None, self._parse_economic_times, page, url)
+        
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Network error scraping Economic Times: {str(e)}")
+        except Exception as e:
+            print(f"Error scraping Economic Times: {str(e)}")
+        
+        return []
+    
+    def _parse_economic_times(self, page: Page, url: str) -> List[Tuple[Dict[str, Any], set]]:
+        """Extract news items that name a tracked symbol, paired with the symbols they name"""
+        news_items = []
+        soup = _make_soup(page, _STRAINERS['et'])
+        scraped_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')  # One timestamp for the whole page
+        
+        # Try different possible article selectors
+        articles = []
+        selectors = [
+            '.eachStory',  # Main article container
+            '.story_list',  # Alternative container
+            '.newslist',    # Another possible container
+            'div[data-tracking-name="Story_List"]'  # Data attribute based selector
+        ]
+        
+        for selector in selectors[:-1]:
+            articles = soup.select(selector)
+            if articles:
+                break
+        else:
+            # The data attribute fallback can't share a strainer with the class selectors
+            soup = _make_soup(page, _STRAINERS['et_tracking'])
+            articles = soup.select(selectors[-1])
+        
+        # Extract news items, skipping articles whose title names no tracked symbol
+        for article in articles:
+            try:
+                # Try different title selectors
+                title_elem = _ET_TITLE.select_one(article)
+                
+                if not title_elem:
+                    continue
+                    
+                title = title_elem.get_text(strip=True)
+                symbols = self._match_symbols(title)
+                if not symbols:
+                    continue
+                
+                # Try different summary selectors
+                summary_elem = _ET_SUMMARY.select_one(article)
+                
+                summary = summary_elem.get_text(strip=True) if summary_elem else "No summary available"
+                
+                # Try different link selectors
+                first_link = _LINK.select_one(article)
+                link_elem = (title_elem.get('href') or first_link.get('href')) if first_link else None
+                
+                if link_elem:
+                    # Make sure link is absolute
+                    link_elem = urljoin('https://economictimes.indiatimes.com', link_elem)
+                else:
+                    link_elem = url  # Use main URL if no specific link found
+                
+                news_items.append(({
+                    'timestamp': scraped_at,
+                    'source': 'Economic Times',
+                    'title': title,
+                    'summary': summary,
+                    'link': link_elem,
+                    'type': _categorize_news(title, summary)
+                }, symbols))
+            
+            except Exception as e:
+                print(f"Error parsing individual Economic Times article: {str(e)}")
+                continue
+        
+        return news_items
+    
+    async def _refresh_cycle(self):
+        """Refetch MoneyControl stock news for every symbol once per fetch interval"""
+        while self.running:
+            await asyncio.sleep(self.news_fetch_interval.total_seconds())
+            await self._fetch_stock_news(self.symbols)
+    
     def _fetch_all_news(self):
         """Fetch news for all symbols from MoneyControl"""
-        for symbol in self.symbols:
+        self._run(self._fetch_stock_news(self.symbols))
+    
+    async def _fetch_stock_news(self, symbols: List[str]):
+        """Fetch MoneyControl news for the given symbols and queue it"""
+        for symbol in symbols:
             try:
-                news_items = self.moneycontrol.get_stock_news(symbol)
-                for item in news_items:
-                    self.news_queue.put({
-                        'symbol': symbol,
-                        'news': item
-                    })
+                news_items = await self.moneycontrol.get_stock_news(symbol)
+                if news_items:
+                    self.news_queue.put([{'symbol': symbol, 'news': item} for item in news_items])
                 self.last_news_fetch[symbol] = datetime.now()
             except Exception as e:
                 print(f"Error fetching news for {symbol}: {str(e)}")
     
     def _process_news(self):
-        """Process news items from queue"""
+        """Process news from queue, blocking until some arrives and then draining everything queued
+        
+        Producers put one list of {'symbol', 'news'} items per scrape, so each queue operation
+        moves a whole batch.
+        """
         while self.running:
+            batches = [self.news_queue.get()]
             try:
-                # Check if we need to fetch fresh news
-                current_time = datetime.now()
-                for symbol in self.symbols:
-                    if current_time - self.last_news_fetch[symbol] > self.news_fetch_interval:
-                        news_items = self.moneycontrol.get_stock_news(symbol)
-                        for item in news_items:
-                            self.news_queue.put({
-                                'symbol': symbol,
-                                'news': item
-                            })
-                        self.last_news_fetch[symbol] = current_time
+                while True:
+                    batches.append(self.news_queue.get_nowait())
+            except queue.Empty:
+                pass
+            
+            for batch in batches:
+                if batch is None:  # Posted by stop()
+                    return
                 
-                # Process news from queue
-                try:
-                    news_data = self.news_queue.get(timeout=1)
-                    
-                    # Add to latest news
-                    self.latest_news.insert(0, {
-                        'timestamp': news_data['news']['timestamp'],
-                        'symbol': news_data['symbol'],
-                        'source': news_data['news']['source'],
-                        'type': news_data['news']['type'],
-                        'title': news_data['news']['title'],
-                        'summary': news_data['news']['summary'],
-                        'link': news_data['news']['link']
-                    })
-                    
-                    # Keep only recent news
-                    if len(self.latest_news) > self.max_news:
-                        self.latest_news = self.latest_news[:self.max_news]
+                for news_data in batch:
+                    try:
+                        # Add to latest news
+                        self._add_news({
+                            'timestamp': news_data['news']['timestamp'],
+                            'symbol': news_data['symbol'],
+                            'source': news_data['news']['source'],
+                            'type': news_data['news']['type'],
+                            'title': news_data['news']['title'],
+                            'summary': news_data['news']['summary'],
+                            'link': news_data['news']['link']
+                        })
                     
-                except queue.Empty:
-                    continue
-                
-            except Exception as e:
-                print(f"Error processing news: {str(e)}")
-                time.sleep(1)
+                    except Exception as e:
+                        print(f"Error processing news: {str(e)}")
+    
+    def _add_news(self, item: Dict[str, Any]):
+        """Push an item onto latest_news, keeping the source/symbol counts in step with evictions"""
+        if len(self.latest_news) == self.max_news:
+            evicted = self.latest_news[-1]
+            self._discount(self._source_counts, evicted['source'])
+            self._discount(self._symbol_counts, evicted['symbol'])
+        
+        self.latest_news.appendleft(item)
+        self._source_counts[item['source']] += 1
+        self._symbol_counts[item['symbol']] += 1
+    
+    @staticmethod
+    def _discount(counts: Counter, key: str):
+        """Decrement a count, dropping the key once it reaches zero so len() counts distinct keys"""
+        counts[key] -= 1
+        if counts[key] <= 0:
+            del counts[key]
     
     def get_latest_news(self, limit: int = None, symbol: str = None, news_type: str = None) -> List[Dict[str, Any]]:
         """Get latest news with optional filtering"""
-        news = self.latest_news
+        # Snapshot first; the processor thread keeps appending while we filter
+        news = list(self.latest_news)
         
         # Apply filters
         if symbol:
-            news = [item for item in news if item['symbol'] == symbol]
+            news = (item for item in news if item['symbol'] == symbol)
         if news_type:
-            news = [item for item in news if item['type'] == news_type]
+            news = (item for item in news if item['type'] == news_type)
         
-        # Apply limit
-        if limit:
-            news = news[:limit]
-        
-        return news
+        # Apply limit, stopping the scan as soon as enough items match
+        return list(islice(news, limit or None))
     
     def get_news_summary(self) -> Dict[str, Any]:
         """Get summary of news activity"""
+        news = self.latest_news
         return {
-            'total_news': len(self.latest_news),
-            'sources': len(set(item['source'] for item in self.latest_news)),
-            'symbols_covered': len(set(item['symbol'] for item in self.latest_news)),
-            'latest_update': self.latest_news[0]['timestamp'] if self.latest_news else None
+            'total_news': len(news),
+            'sources': len(self._source_counts),
+            'symbols_covered': len(self._symbol_counts),
+            'latest_update': news[0]['timestamp'] if news else None
         } 
\ No newline at end of file
@@ -1,12 +1,16 @@
 import threading
 import queue
-import time
 from datetime import datetime
 from typing import Dict, Any, List
-import json
+import orjson
 from pathlib import Path
 import subprocess
 import os
+import sys
+from collections import deque
+import logging
+
+logger = logging.getLogger(__name__)
 
 class RealtimeProcessor:
     def __init__(self):
@@ -20,8 +24,15 @@ class RealtimeProcessor:
             "transactions": [],
             "capital": 0,
             "initial_capital": 0,
-            "news": []
+            "news": deque(maxlen=100)  # Latest 100 news items, newest first
+        }
+        self._lock = threading.RLock()  # Guards current_data and the snapshot built from it
+        self._handlers = {
+            "portfolio_update": self._on_portfolio,
+            "transaction": self._on_transaction,
+            "news": self._on_news
         }
+        self._snapshot = self._build_snapshot()
     
     def start_finmem(self, config: Dict[str, Any] = None):
         """Start the FinMem India process"""
@@ -37,8 +48,8 @@ class RealtimeProcessor:
         # Save configuration if provided
         if config:
             config_path = data_dir / "config.json"
-            with open(config_path, "w") as f:
-                json.dump(config, f)
+            with open(config_path, "wb") as f:
+                f.write(orjson.dumps(config))
         
         # Start FinMem India process
         try:
@@ -46,8 +57,7 @@ class RealtimeProcessor:
             self.finmem_process = subprocess.Popen(
                 ["python", "finmem_india/main.py"],
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                universal_newlines=True
+                stderr=subprocess.PIPE
             )
             
             # Start data processing thread
@@ -72,56 +82,120 @@ class RealtimeProcessor:
             self.data_thread = None
     
     def _process_data(self):
-        """Process data from FinMem India"""
-        while self.running:
-            try:
-                # Read output from FinMem process
-                if self.finmem_process:
-                    line = self.finmem_process.stdout.readline()
-                    if line:
-                        # Parse and process the data
-                        self._update_data(line.strip())
+        """Process data from FinMem India a chunk of lines at a time"""
+        process = self.finmem_process
+        rxbuf = bytearray()  # Reused across reads; consumed lines are trimmed off the front
+        try:
+            # read1 blocks until some output is available, and returns b'' once the process closes stdout
+            while self.running:
+                chunk = process.stdout.read1(65536)
+                if not chunk:
+                    break
                 
-                # Update timestamp
-                self.last_update = datetime.now()
+                # Only the new bytes can hold newlines we haven't seen yet
+                scan = len(rxbuf)
+                rxbuf += chunk
+                consumed = self._consume_lines(rxbuf, scan)
+                if not consumed:
+                    continue
                 
-                # Small delay to prevent CPU overuse
-                time.sleep(0.1)
+                # Trim the parsed lines, keeping any trailing partial line for the next read
+                del rxbuf[:consumed]
                 
-            except Exception as e:
-                print(f"Error processing data: {str(e)}")
-                time.sleep(1)
+                # Update timestamp
+                self.last_update = datetime.now()
+            
+            # A last line without a trailing newline is still a message
+            if rxbuf:
+                self._update_data([memoryview(rxbuf)])
+        
+        except Exception as e:
+            logger.error("Error processing data: %s", e)
     
-    def _update_data(self, data_line: str):
-        """Update current data with new information"""
-        try:
-            data = json.loads(data_line)
+    def _consume_lines(self, rxbuf: bytearray, scan: int) -> int:
+        """Apply every complete line in rxbuf, returning how many bytes they took up"""
+        consumed = 0
+        end = rxbuf.find(b'\n', scan)
+        if end == -1:
+            return 0
+        
+        # Slice views over the buffer so lines aren't copied before parsing;
+        # they must all be released before rxbuf can be resized
+        with memoryview(rxbuf) as view:
+            lines = []
+            while end != -1:
+                lines.append(view[consumed:end])
+                consumed = end + 1
+                end = rxbuf.find(b'\n', consumed)
             
-            # Update relevant sections based on data type
-            if "type" in data:
-                if data["type"] == "portfolio_update":
-                    self.current_data["portfolio"] = data["portfolio"]
-                    self.current_data["capital"] = data["capital"]
-                
-                elif data["type"] == "transaction":
-                    self.current_data["transactions"].append(data["transaction"])
-                
-                elif data["type"] == "news":
-                    self.current_data["news"].insert(0, data["news"])
-                    # Keep only latest 100 news items
-                    self.current_data["news"] = self.current_data["news"][:100]
+            # Parse and process the whole batch; orjson reads the views directly.
+            # A failed batch is dropped, and the views are released either way so
+            # trimming rxbuf can't fail and end the reader
+            try:
+                self._update_data(lines)
+            except Exception as e:
+                logger.error("Error processing data: %s", e)
+            finally:
+                for line in lines:
+                    line.release()
+        
+        return consumed
+    
+    def _update_data(self, data_lines: List[memoryview]):
+        """Update current data with a batch of new messages"""
+        applied = False
+        with self._lock:
+            for data_line in data_lines:
+                if not data_line:
+                    continue
+                try:
+                    data = orjson.loads(data_line)
+                    
+                    # Update relevant sections based on data type
+                    handler = self._handlers.get(data.get("type"))
+                    if handler is not None:
+                        handler(data)
+                    applied = True
+                    
+                except orjson.JSONDecodeError:
+                    logger.warning("Invalid JSON data: %r", bytes(data_line).strip())
+                except Exception as e:
+                    logger.error("Error updating data: %s", e)
             
-            # Put updated data in queue for UI
-            self.data_queue.put(self.current_data.copy())
+            if not applied:
+                return
             
-        except json.JSONDecodeError:
-            print(f"Invalid JSON data: {data_line}")
-        except Exception as e:
-            print(f"Error updating data: {str(e)}")
+            # Rebuild the snapshot once per batch rather than once per message or read
+            self._snapshot = self._build_snapshot()
+        
+        # Put updated data in queue for UI
+        self.data_queue.put(self._snapshot)
+    
+    def _on_portfolio(self, data: Dict[str, Any]):
+        """Apply a portfolio_update message"""
+        # Intern symbols so repeated updates reuse one string per symbol
+        self.current_data["portfolio"] = {sys.intern(sym): pos for sym, pos in data["portfolio"].items()}
+        self.current_data["capital"] = data["capital"]
+    
+    def _on_transaction(self, data: Dict[str, Any]):
+        """Apply a transaction message"""
+        transaction = data["transaction"]
+        if "symbol" in transaction:
+            transaction["symbol"] = sys.intern(transaction["symbol"])
+        self.current_data["transactions"].append(transaction)
+    
+    def _on_news(self, data: Dict[str, Any]):
+        """Apply a news message"""
+        self.current_data["news"].appendleft(data["news"])
+    
+    def _build_snapshot(self) -> Dict[str, Any]:
+        """Build a read-only view of current_data with news as a list"""
+        with self._lock:
+            return {**self.current_data, "news": list(self.current_data["news"])}
     
     def get_latest_data(self) -> Dict[str, Any]:
-        """Get the latest data for UI updates"""
-        return self.current_data.copy()
+        """Get the latest data for UI updates; shared between readers, so don't mutate it"""
+        return self._snapshot
     
     def is_running(self) -> bool:
         """Check if FinMem India is running"""
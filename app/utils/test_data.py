@@ -60,9 +60,10 @@ def create_sample_transactions(portfolio):
     
     # Add some historical transactions
     symbols = get_nifty50_symbols()
-    for _ in range(5):  # Add 5 random historical transactions
-        symbol = random.choice(symbols)
-        action = random.choice(['BUY', 'SELL'])
+    count = 5  # Add 5 random historical transactions
+    
+    # Draw symbols and actions for all of them at once
+    for symbol, action in zip(random.choices(symbols, k=count), random.choices(['BUY', 'SELL'], k=count)):
         quantity = random.randint(10, 100)
         price = get_mock_price(symbol)
         
@@ -1,31 +1,162 @@
 from typing import Dict, Any, List
 import random
 from datetime import datetime, timedelta
-import json
+import orjson
+import os
+import sys
+import time
+import queue
+import threading
 from pathlib import Path
 import yfinance as yf
 import pandas as pd
 import numpy as np
+import logging
+
+logger = logging.getLogger(__name__)
+
+TRADE_ACTIONS = ("BUY", "SELL")  # Action codes stored in the transaction columns
+
+def _add_symbol(symbols: List[str], positions: Dict[str, int], symbol: str):
+    """Append a symbol to a list, tracking its index"""
+    positions[symbol] = len(symbols)
+    symbols.append(symbol)
+
+def _remove_symbol(symbols: List[str], positions: Dict[str, int], symbol: str):
+    """Remove a symbol from a list in O(1) by moving the last one into its slot"""
+    i = positions.pop(symbol)
+    last = symbols.pop()
+    if last != symbol:
+        symbols[i] = last
+        positions[last] = i
+
+def _step_prices(rng: np.random.Generator, prices: np.ndarray, vols: np.ndarray, noise: np.ndarray):
+    """Move every price by one normal draw scaled by its volatility, in place"""
+    rng.standard_normal(out=noise)
+    noise *= vols
+    noise += 1.0
+    prices *= noise
 
 class TradingSimulator:
     def __init__(self, config: Dict[str, Any]):
         self.user = config['user']
         self.initial_capital = float(config['initial_capital'])
         self.capital = self.initial_capital
+        self._max_position_capital = self.initial_capital * 0.2  # Max 20% of initial capital per position
         self.risk_profile = config['risk_profile']
         self.portfolio: Dict[str, Dict[str, Any]] = {}
-        self.transactions: List[Dict[str, Any]] = []
+        self._portfolio_mv = 0.0  # Running total of the positions' market_value
+        self.max_transactions = 10_000  # Oldest transactions are dropped beyond this
+        self._init_transactions()
         self.last_update = None
         self.nifty50_symbols = self._get_nifty50_symbols()
-        self.stock_prices = self._initialize_stock_prices()
+        self._index_portfolio()
         self.volatility = {sym: random.uniform(0.01, 0.03) for sym in self.nifty50_symbols}
+        
+        # Prices and volatilities as parallel arrays so each tick is one vectorized step
+        initial_prices = self._initialize_stock_prices()
+        self._idx = {sym: i for i, sym in enumerate(self.nifty50_symbols)}
+        self._prices = np.array([initial_prices[sym] for sym in self.nifty50_symbols], dtype=np.float64)
+        self._vols = np.array([self.volatility[sym] for sym in self.nifty50_symbols], dtype=np.float64)
+        self._rng = np.random.default_rng()
+        self._random = random.Random()  # Trade decisions draw from their own generator, not the module-level one
+        self._noise = np.empty_like(self._prices)  # Reused buffer for each tick's random draw
         self.trade_probability = self._get_trade_probability()
         self.last_trade_time = datetime.now()
         self.min_trade_interval = timedelta(seconds=10)  # Minimum time between trades
+        self.state_file = Path(config.get('state_file', "data/trading_state.json"))
+        self.state_file.parent.mkdir(exist_ok=True)
+        self.persist_interval = 2.0  # Minimum seconds between state writes
+        self._dirty = False  # State changed since the last write
+        self._last_persist = 0.0
+        
+        # Serialized states are written by a background thread; only the newest pending one is kept
+        self._write_queue: queue.Queue = queue.Queue(maxsize=1)
+        self._writer = None  # Started by the first save, stopped by close()
         
         # Load existing state if available
         self._load_state()
     
+    def _init_transactions(self, capacity: int = 64):
+        """Create empty transaction columns, one array or list per field"""
+        self._tx_len = 0
+        self._tx_count = 0  # Transactions recorded since the columns were created, including dropped ones
+        self._tx_ts: List[str] = []
+        self._tx_sym: List[str] = []
+        self._tx_action = np.empty(capacity, dtype=np.uint8)  # Index into TRADE_ACTIONS
+        self._tx_qty = np.empty(capacity, dtype=np.int32)
+        self._tx_price = np.empty(capacity, dtype=np.float64)
+        self._tx_pl = np.empty(capacity, dtype=np.float64)
+    
+    def _grow_transactions(self):
+        """Double the column capacity, dropping rows older than max_transactions"""
+        start = max(0, self._tx_len - self.max_transactions)
+        kept = self._tx_len - start
+        capacity = min(max(2 * self._tx_len, 64), 2 * self.max_transactions)
+        
+        for name in ('_tx_action', '_tx_qty', '_tx_price', '_tx_pl'):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:kept] = old[start:self._tx_len]
+            setattr(self, name, new)
+        del self._tx_ts[:start]
+        del self._tx_sym[:start]
+        self._tx_len = kept
+    
+    def _record_transaction(self, timestamp: str, symbol: str, action: str, quantity: int, price: float, profit_loss: float):
+        """Append one transaction to the columns"""
+        if self._tx_len == len(self._tx_price):
+            self._grow_transactions()
+        
+        i = self._tx_len
+        self._tx_ts.append(timestamp)
+        self._tx_sym.append(symbol)
+        self._tx_action[i] = TRADE_ACTIONS.index(action)
+        self._tx_qty[i] = quantity
+        self._tx_price[i] = price
+        self._tx_pl[i] = profit_loss
+        self._tx_len += 1
+        self._tx_count += 1
+    
+    @property
+    def transaction_count(self) -> int:
+        """Number of transactions recorded so far, usable as an offset for transactions_since"""
+        return self._tx_count
+    
+    @property
+    def transactions(self) -> List[Dict[str, Any]]:
+        """The latest max_transactions transactions as dicts, oldest first"""
+        return self.transactions_since(0)
+    
+    def transactions_since(self, offset: int) -> List[Dict[str, Any]]:
+        """Transactions recorded after the first `offset` ones as dicts, oldest first"""
+        dropped = self._tx_count - self._tx_len
+        start = max(0, self._tx_len - self.max_transactions, offset - dropped)
+        end = self._tx_len
+        quantities = self._tx_qty[start:end]
+        prices = self._tx_price[start:end]
+        
+        return [
+            {
+                'timestamp': timestamp,
+                'symbol': symbol,
+                'action': TRADE_ACTIONS[action],
+                'quantity': quantity,
+                'price': price,
+                'value': value,
+                'profit_loss': profit_loss
+            }
+            for timestamp, symbol, action, quantity, price, value, profit_loss in zip(
+                self._tx_ts[start:],
+                self._tx_sym[start:],
+                self._tx_action[start:end].tolist(),
+                quantities.tolist(),
+                prices.tolist(),
+                (quantities * prices).tolist(),
+                self._tx_pl[start:end].tolist()
+            )
+        ]
+    
     def _get_nifty50_symbols(self) -> List[str]:
         """Get list of Nifty 50 symbols"""
         # For test mode, use a subset of major Indian stocks
@@ -56,31 +187,40 @@ class TradingSimulator:
             "Risk-Seeking": 0.8
         }.get(self.risk_profile, 0.5)
     
-    def _update_prices(self):
-        """Update stock prices with realistic movements"""
-        for symbol in self.stock_prices:
-            # Generate realistic price movement
-            change_pct = np.random.normal(0, self.volatility[symbol])
-            self.stock_prices[symbol] *= (1 + change_pct)
-            
-            # Update portfolio values
-            if symbol in self.portfolio:
-                self.portfolio[symbol]['current_price'] = self.stock_prices[symbol]
-                self.portfolio[symbol]['market_value'] = (
-                    self.portfolio[symbol]['quantity'] * self.stock_prices[symbol]
-                )
-                self.portfolio[symbol]['profit_loss'] = (
-                    self.portfolio[symbol]['market_value'] -
-                    (self.portfolio[symbol]['quantity'] * self.portfolio[symbol]['avg_price'])
-                )
+    @property
+    def stock_prices(self) -> Dict[str, float]:
+        """Current price of every symbol"""
+        return dict(zip(self.nifty50_symbols, self._prices.tolist()))
     
-    def _should_trade(self) -> bool:
+    def _price(self, symbol: str) -> float:
+        """Current price of one symbol"""
+        return float(self._prices[self._idx[symbol]])
+    
+    def _update_prices(self, step: bool = True):
+        """Update stock prices with realistic movements; step=False when a SimulatorPool already moved them"""
+        # Generate realistic price movements for every symbol in one draw, in place
+        if step:
+            _step_prices(self._rng, self._prices, self._vols, self._noise)
+        
+        # Update portfolio values, re-totalling them on the same pass
+        portfolio_mv = 0.0
+        for symbol, position in self.portfolio.items():
+            price = self._price(symbol)
+            position['current_price'] = price
+            position['market_value'] = position['quantity'] * price
+            portfolio_mv += position['market_value']
+            position['profit_loss'] = (
+                position['market_value'] - (position['quantity'] * position['avg_price'])
+            )
+        self._portfolio_mv = portfolio_mv
+    
+    def _should_trade(self, now: datetime) -> bool:
         """Determine if a trade should be made"""
-        if datetime.now() - self.last_trade_time < self.min_trade_interval:
+        if now - self.last_trade_time < self.min_trade_interval:
             return False
-        return random.random() < self.trade_probability
+        return self._random.random() < self.trade_probability
     
-    def _generate_trade(self):
+    def _generate_trade(self, now: datetime):
         """Generate a realistic trade"""
         # Select action (buy/sell)
         if not self.portfolio:
@@ -88,35 +228,35 @@ class TradingSimulator:
         elif len(self.portfolio) >= 10:
             action = "SELL"  # Force sell if portfolio is too large
         else:
-            action = random.choice(["BUY", "SELL"])
+            action = self._random.choice(["BUY", "SELL"])
         
         if action == "SELL" and not self.portfolio:
             return None  # Can't sell if nothing in portfolio
         
         # Select symbol
         if action == "BUY":
-            available_symbols = [s for s in self.nifty50_symbols if s not in self.portfolio]
-            if not available_symbols:
+            if not self._available_syms:
                 return None
-            symbol = random.choice(available_symbols)
+            symbol = self._random.choice(self._available_syms)
         else:
-            symbol = random.choice(list(self.portfolio.keys()))
+            symbol = self._random.choice(self._portfolio_syms)
         
-        current_price = self.stock_prices[symbol]
+        current_price = self._price(symbol)
         
         # Calculate quantity based on available capital and position size
         if action == "BUY":
-            max_capital = min(self.capital, self.initial_capital * 0.2)  # Max 20% of initial capital per position
+            max_capital = min(self.capital, self._max_position_capital)
             max_quantity = int(max_capital / current_price)
-            quantity = random.randint(1, max_quantity) if max_quantity > 0 else 0
+            quantity = self._random.randint(1, max_quantity) if max_quantity > 0 else 0
         else:
             max_quantity = self.portfolio[symbol]['quantity']
-            quantity = random.randint(1, max_quantity)
+            quantity = self._random.randint(1, max_quantity)
         
         if quantity == 0:
             return None
         
         value = quantity * current_price
+        position_value = self.portfolio[symbol]['market_value'] if symbol in self.portfolio else 0.0
         
         # Execute trade
         if action == "BUY":
@@ -134,6 +274,8 @@ class TradingSimulator:
                     'market_value': value,
                     'profit_loss': 0
                 }
+                _add_symbol(self._portfolio_syms, self._portfolio_pos, symbol)
+                _remove_symbol(self._available_syms, self._available_pos, symbol)
             else:
                 total_quantity = self.portfolio[symbol]['quantity'] + quantity
                 total_value = (
@@ -154,13 +296,22 @@ class TradingSimulator:
             remaining_quantity = self.portfolio[symbol]['quantity'] - quantity
             if remaining_quantity == 0:
                 del self.portfolio[symbol]
+                _remove_symbol(self._portfolio_syms, self._portfolio_pos, symbol)
+                if symbol in self._idx:
+                    _add_symbol(self._available_syms, self._available_pos, symbol)
             else:
                 self.portfolio[symbol]['quantity'] = remaining_quantity
                 self.portfolio[symbol]['market_value'] = remaining_quantity * current_price
         
+        # Move the running total by however much this position's value changed
+        if symbol in self.portfolio:
+            self._portfolio_mv += self.portfolio[symbol]['market_value'] - position_value
+        else:
+            self._portfolio_mv -= position_value
+        
         # Record transaction
         transaction = {
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'timestamp': f"{now:%Y-%m-%d %H:%M:%S}",
             'symbol': symbol,
             'action': action,
             'quantity': quantity,
@@ -169,32 +320,41 @@ class TradingSimulator:
             'profit_loss': profit_loss if action == "SELL" else 0
         }
         
-        self.transactions.append(transaction)
-        self.last_trade_time = datetime.now()
-        
-        # Save state after each trade
-        self._save_state()
+        self._record_transaction(
+            transaction['timestamp'], symbol, action, quantity, current_price, transaction['profit_loss']
+        )
+        self.last_trade_time = now
         
         return transaction
     
-    def update(self):
+    def _index_portfolio(self):
+        """Rebuild the held and available symbol lists from the portfolio"""
+        # Each list has an index map so symbols move between them in O(1)
+        self._portfolio_syms = list(self.portfolio)
+        self._portfolio_pos = {sym: i for i, sym in enumerate(self._portfolio_syms)}
+        self._available_syms = [sym for sym in self.nifty50_symbols if sym not in self.portfolio]
+        self._available_pos = {sym: i for i, sym in enumerate(self._available_syms)}
+    
+    def update(self, step_prices: bool = True):
         """Update simulation state"""
-        self._update_prices()
+        now = datetime.now()  # One clock read per tick
+        self._update_prices(step_prices)
         
         # Generate trades more frequently
-        if self._should_trade():
-            trade = self._generate_trade()
+        if self._should_trade(now):
+            trade = self._generate_trade(now)
             if trade:
-                print(f"Trade executed: {trade['action']} {trade['quantity']} {trade['symbol']} @ {trade['price']}")
+                logger.debug("Trade executed: %s %d %s @ %s", trade['action'], trade['quantity'], trade['symbol'], trade['price'])
         
-        self.last_update = datetime.now()
+        self.last_update = now
         
-        # Save state after each update
+        # Save state, at most once per persist interval
+        self._dirty = True
         self._save_state()
     
     def get_state(self) -> Dict[str, Any]:
         """Get current simulation state"""
-        total_value = self.capital + sum(pos['market_value'] for pos in self.portfolio.values())
+        total_value = self.capital + self._portfolio_mv
         total_pl = total_value - self.initial_capital
         
         return {
@@ -205,37 +365,138 @@ class TradingSimulator:
             'total_pl': total_pl,
             'pl_pct': (total_pl / self.initial_capital) * 100 if self.initial_capital > 0 else 0,
             'portfolio': self.portfolio,
-            'transactions': self.transactions,
+            'transaction_count': self._tx_count,
             'risk_profile': self.risk_profile,
             'last_update': self.last_update
         }
     
-    def _save_state(self):
-        """Save current state to file"""
+    def _save_state(self, force: bool = False):
+        """Save current state to file, skipping writes that come too soon after the last one unless forced"""
+        if not force and (not self._dirty or time.monotonic() - self._last_persist < self.persist_interval):
+            return
+        
+        # Serialize here so the writer never sees the portfolio mid-update;
+        # orjson handles the datetime in last_update and numpy prices natively
         state = self.get_state()
-        state_file = Path("data/trading_state.json")
-        state_file.parent.mkdir(exist_ok=True)
+        state['transactions'] = self.transactions
+        payload = orjson.dumps(state, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._write_states, daemon=True)
+            self._writer.start()
         
-        with open(state_file, "w") as f:
-            json.dump(state, f, indent=2)
+        # Replace a state the writer hasn't picked up yet, it's already stale
+        try:
+            self._write_queue.put_nowait(payload)
+        except queue.Full:
+            try:
+                self._write_queue.get_nowait()
+                self._write_queue.task_done()
+            except queue.Empty:
+                pass
+            self._write_queue.put_nowait(payload)
+        
+        self._dirty = False
+        self._last_persist = time.monotonic()
+    
+    def _write_states(self):
+        """Writer thread: persist each serialized state handed over by _save_state until close() sends None"""
+        while True:
+            payload = self._write_queue.get()
+            if payload is None:
+                self._write_queue.task_done()
+                return
+            try:
+                # Write a temp file and swap it in so a crash never leaves a half-written state
+                tmp_file = self.state_file.with_suffix(self.state_file.suffix + ".tmp")
+                with open(tmp_file, "wb") as f:
+                    f.write(payload)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, self.state_file)
+            except OSError as e:
+                logger.error("Error saving trading state: %s", e)
+            finally:
+                self._write_queue.task_done()
+    
+    def flush(self):
+        """Write any state changes still held back by the persist interval, and wait for the writer"""
+        if self._dirty:
+            self._save_state(force=True)
+        self._write_queue.join()
+    
+    def close(self):
+        """Flush, then stop the writer thread so the simulator can be collected; a later save starts a new one"""
+        self.flush()
+        if self._writer is not None:
+            self._write_queue.put(None)
+            self._writer.join()
+            self._writer = None
     
     def _load_state(self):
         """Load state from file"""
-        state_file = Path("data/trading_state.json")
+        state_file = self.state_file
         if state_file.exists():
-            with open(state_file, "r") as f:
-                state = json.load(f)
+            with open(state_file, "rb") as f:
+                state = orjson.loads(f.read())
             
             self.capital = state.get('capital', self.initial_capital)
-            self.portfolio = state.get('portfolio', {})
-            self.transactions = state.get('transactions', [])
+            # Intern loaded symbols so they share storage with the symbol list
+            self.portfolio = {sys.intern(sym): pos for sym, pos in state.get('portfolio', {}).items()}
+            for symbol, position in self.portfolio.items():
+                position['symbol'] = symbol
+            self._portfolio_mv = sum(pos['market_value'] for pos in self.portfolio.values())
+            self._index_portfolio()
+            self._init_transactions()
+            for txn in state.get('transactions', [])[-self.max_transactions:]:
+                self._record_transaction(
+                    txn.get('timestamp', txn.get('date')), sys.intern(txn['symbol']), txn['action'],
+                    txn['quantity'], txn['price'], txn.get('profit_loss', 0)
+                )
             self.last_update = datetime.now()
     
     def reset_capital(self, new_capital: float):
         """Reset capital to new value"""
         self.initial_capital = new_capital
         self.capital = new_capital
+        self._max_position_capital = new_capital * 0.2
         self.portfolio.clear()
-        self.transactions.clear()
+        self._portfolio_mv = 0.0
+        self._index_portfolio()
+        self._init_transactions()
         self.last_update = datetime.now()
-        self._save_state() 
\ No newline at end of file
+        self._save_state(force=True)
+
+class SimulatorPool:
+    """Steps several simulators together, drawing all their price moves in one batch"""
+    def __init__(self, configs: List[Dict[str, Any]]):
+        # Each member persists to its own file; members without one get a numbered default
+        configs = [
+            {**config, 'state_file': config.get('state_file', f"data/trading_state_{i}.json")}
+            for i, config in enumerate(configs)
+        ]
+        state_files = [Path(config['state_file']).resolve() for config in configs]
+        if len(set(state_files)) != len(state_files):
+            raise ValueError("Each simulator in a pool needs its own state_file")
+        self.simulators = [TradingSimulator(config) for config in configs]
+        
+        # Stack every simulator's prices and volatilities into (simulators x symbols) matrices,
+        # then point each simulator at its row so its own bookkeeping sees the shared prices
+        self._prices = np.stack([sim._prices for sim in self.simulators])
+        self._vols = np.stack([sim._vols for sim in self.simulators])
+        self._noise = np.empty_like(self._prices)
+        self._rng = np.random.default_rng()
+        for row, sim in enumerate(self.simulators):
+            sim._prices = self._prices[row]
+            sim._vols = self._vols[row]
+    
+    def update(self):
+        """Update every simulator"""
+        _step_prices(self._rng, self._prices, self._vols, self._noise)
+        for sim in self.simulators:
+            sim.update(step_prices=False)
+    
+    def flush(self):
+        """Write any state changes the simulators are still holding back and stop their writer threads"""
+        for sim in self.simulators:
+            sim.close()
@@ -1,4 +1,5 @@
-from typing import Dict, Any
+from typing import Dict, Any, List
+from datetime import datetime
 import pandas as pd
 from pathlib import Path
 from loguru import logger
@@ -12,8 +13,32 @@ import signal
 import sys
 import threading
 import random
+import hashlib
+import inspect
 import yfinance as yf
 
+# Per-symbol fields kept in market data memories, in record order after Symbol
+MEMORY_COLUMNS = ["Open", "High", "Low", "Close", "Volume", "Daily_Return", "RSI", "20d_MA", "50d_MA", "Volume_MA"]
+
+# Bump when the cached market panel's columns or dtypes change
+MARKET_CACHE_VERSION = 1
+
+def _mtime(path) -> float:
+    """Modification time of a file or directory, 0 if it does not exist"""
+    try:
+        return Path(path).stat().st_mtime
+    except OSError:
+        return 0.0
+
+def _prepare_panel(market_data: pd.DataFrame) -> pd.DataFrame:
+    """Sort a (Date, Symbol) panel and compute and fill its memory columns once for the whole backtest"""
+    # Day-over-day return per symbol, computed once for the whole panel
+    market_data = market_data.sort_index()
+    market_data["Daily_Return"] = market_data.groupby(level="Symbol")["Close"].pct_change(fill_method=None)
+    # Cast and fill the memory columns for the whole panel up front, so each date only slices
+    market_data[MEMORY_COLUMNS] = market_data[MEMORY_COLUMNS].astype(float).fillna({"Daily_Return": 0.0, "RSI": 50.0})
+    return market_data
+
 class Simulation:
     """Trading simulation with news integration"""
     
@@ -66,57 +91,24 @@ class Simulation:
 
             if self.mode == "backtest":
                 # Load all market data
-                market_data = self.data_loader.load_data()
-                all_dates = sorted(set(market_data.index.get_level_values("Date")))
+                market_data = _prepare_panel(self._load_market_data())
                 watched_symbols = self.config["market"]["symbols"]
-                for current_date in all_dates:
+                # Days are added to memory in batches, so it is sorted and trimmed once per batch
+                batch_days = self.config["memory"].get("update_batch_days", 5)
+                pending_memories = []
+                # One pass over the sorted panel yields each date's rows
+                for current_date, daily_data in market_data.groupby(level="Date", sort=True):
                     iteration += 1
                     logger.info(f"\nBacktest Iteration {iteration} - {current_date.date()}")
-                    # Get daily data for all symbols for this date
-                    try:
-                        daily_data = market_data.loc[current_date]
-                    except Exception as e:
-                        logger.error(f"No data for {current_date}: {e}")
-                        continue
-                    # Convert to MultiIndex for compatibility
-                    daily_data.index = pd.MultiIndex.from_tuples(
-                        [(current_date, idx) for idx in daily_data.index.get_level_values("Symbol")],
-                        names=["Date", "Symbol"]
-                    )
+                    # The agent works on symbol-indexed rows
+                    daily_data = daily_data.droplevel("Date")
                     # Prepare daily_dict for agent memory
-                    daily_dict = {"date": current_date, "data": []}
-                    for symbol in watched_symbols:
-                        try:
-                            row = daily_data.loc[pd.IndexSlice[current_date, symbol], :]
-                            current_price = float(row["Close"])
-                            open_price = float(row["Open"])
-                            high = float(row["High"])
-                            low = float(row["Low"])
-                            prev_close = float(row["Close"])
-                            volume = float(row["Volume"])
-                            daily_return = (current_price - prev_close) / prev_close if prev_close else 0
-                            rsi = float(row["RSI"]) if pd.notna(row["RSI"]) else 50.0
-                            ma_20 = float(row["20d_MA"]) if pd.notna(row["20d_MA"]) else None
-                            ma_50 = float(row["50d_MA"]) if pd.notna(row["50d_MA"]) else None
-                            volume_ma = float(row["Volume_MA"]) if pd.notna(row["Volume_MA"]) else None
-                            daily_dict["data"].append({
-                                "Symbol": symbol,
-                                "Open": open_price,
-                                "High": high,
-                                "Low": low,
-                                "Close": current_price,
-                                "Volume": volume,
-                                "Daily_Return": daily_return,
-                                "RSI": rsi,
-                                "20d_MA": ma_20,
-                                "50d_MA": ma_50,
-                                "Volume_MA": volume_ma
-                            })
-                        except Exception as e:
-                            logger.error(f"Error processing symbol {symbol} on {current_date}: {e}")
-                            continue
-                    # Update agent's memory
-                    self.agent.update_memory(daily_dict)
+                    daily_dict = {"date": current_date, "frame": self._market_frame(daily_data, watched_symbols)}
+                    # Update agent's memory once a batch of days has been collected
+                    pending_memories.append(daily_dict)
+                    if len(pending_memories) >= batch_days:
+                        self.agent.update_memories(pending_memories)
+                        pending_memories = []
                     
                     # Get trading decisions from agent
                     decisions = self.agent.make_decisions(
@@ -173,6 +165,9 @@ class Simulation:
                     logger.info(f"Initial Capital: ₹{initial_capital:,.2f}")
                     logger.info(f"Current Value:  ₹{current_value:,.2f}")
                     logger.info(f"Profit/Loss:    ₹{profit_loss:,.2f} ({profit_loss_pct:,.2f}%)")
+                # Add the days left over from the last partial batch
+                if pending_memories:
+                    self.agent.update_memories(pending_memories)
                 # Print final summary when stopped
                 final_value = self.portfolio.get_total_value()
                 total_profit_loss = final_value - initial_capital
@@ -205,9 +200,9 @@ class Simulation:
                 watched_symbols = self.config["market"]["symbols"]
                 # Fetch real-time prices for all symbols
                 real_time_prices = self.get_realtime_prices(watched_symbols)
-                # Initialize daily_dict for this iteration
-                from datetime import datetime
-                daily_dict = {"date": datetime.now(), "data": []}
+                # Initialize daily_dict for this iteration; one timestamp covers the whole tick
+                now = datetime.now()
+                daily_dict = {"date": now, "data": []}
                 # Optionally, create a dummy daily_data DataFrame for compatibility
                 daily_data_rows = []
                 for symbol in watched_symbols:
@@ -240,10 +235,10 @@ class Simulation:
                         "50d_MA": None,
                         "Volume_MA": None
                     })
-                # Create a DataFrame for daily_data for compatibility
+                # Create a symbol-indexed DataFrame for daily_data for compatibility
                 if daily_data_rows:
                     daily_data = pd.DataFrame([row for _, row in daily_data_rows],
-                                             index=pd.MultiIndex.from_tuples([(datetime.now(), symbol) for symbol, _ in daily_data_rows], names=["Date", "Symbol"]))
+                                             index=pd.Index([symbol for symbol, _ in daily_data_rows], name="Symbol"))
                 else:
                     daily_data = pd.DataFrame()
                 # Update agent's memory with new market data if there is any data
@@ -256,12 +251,12 @@ class Simulation:
                 decisions = self.agent.make_decisions(
                     daily_data,
                     self.portfolio.get_state(),
-                    datetime.now()
+                    now
                 )
                 
                 # Log decisions
                 if decisions:
-                    logger.info(f"\nTrading Decisions for {datetime.now()}:")
+                    logger.info(f"\nTrading Decisions for {now}:")
                     for symbol, action in decisions.items():
                         logger.info(f"{symbol}: {action['action'].upper()} {action['quantity']} shares at ₹{action['price']:.2f}")
                         logger.info(f"Reason: {action.get('reason', 'No reason provided')}")
@@ -298,7 +293,7 @@ class Simulation:
                         logger.error(f"Error executing trade for {symbol}: {str(e)}")
                 
                 # Save daily results
-                self._save_daily_results(datetime.now())
+                self._save_daily_results(now)
                 # Print iteration summary
                 current_value = self.portfolio.get_total_value()
                 profit_loss = current_value - initial_capital
@@ -326,6 +321,34 @@ class Simulation:
             logger.error(f"Error in simulation: {str(e)}")
             raise
     
+    def _load_market_data(self) -> pd.DataFrame:
+        """Load the backtest panel, reusing a local copy from an earlier run with the same market settings"""
+        market = self.config["market"]
+        data_path = market.get("data_path")
+        # Changes to the source data or to the loader's indicator code invalidate the copy
+        key = repr((
+            MARKET_CACHE_VERSION, market["symbols"], market["data_start_date"], market["data_end_date"],
+            data_path, _mtime(data_path) if data_path else None, _mtime(inspect.getfile(type(self.data_loader)))
+        ))
+        cache_file = Path(".cache") / f"market_{hashlib.md5(key.encode()).hexdigest()}.pkl"
+        
+        if cache_file.exists():
+            logger.info(f"Loading cached market data from {cache_file}")
+            return pd.read_pickle(cache_file)
+        
+        market_data = self.data_loader.load_data()
+        cache_file.parent.mkdir(exist_ok=True)
+        market_data.to_pickle(cache_file)
+        return market_data
+    
+    def _market_frame(self, daily_data: pd.DataFrame, symbols: List[str]) -> pd.DataFrame:
+        """One date's memory rows as a compact float frame; missing averages stay NaN until materialized"""
+        # Watched symbols with data on this date, in watch-list order
+        present = pd.Index(symbols).intersection(daily_data.index, sort=False)
+        
+        # The panel was cast and filled once in run, so this is a plain slice
+        return daily_data.loc[present, MEMORY_COLUMNS].reset_index(names="Symbol")
+    
     def _save_daily_results(self, date):
         """Save daily portfolio state and performance metrics"""
         results = {
@@ -358,12 +381,20 @@ class Simulation:
             logger.info("Stopped simulation")
 
     def get_realtime_prices(self, symbols):
+        """Latest price per symbol, from one download covering every ticker"""
         tickers = [f"{sym}.NS" for sym in symbols]
-        data = yf.download(tickers, period="1d", interval="1m")
+        data = yf.download(tickers, period="1d", interval="1m", progress=False, group_by="column")
+        try:
+            close = data["Close"]
+            if isinstance(close, pd.Series):
+                close = close.to_frame(tickers[0])
+            # Last valid price of every ticker in one pass
+            last = close.ffill().iloc[-1]
+        except Exception:
+            last = pd.Series(dtype=float)
+        
         last_prices = {}
-        for sym in symbols:
-            try:
-                last_prices[sym] = float(data['Close'][f"{sym}.NS"].dropna()[-1])
-            except Exception:
-                last_prices[sym] = None
+        for sym, ticker in zip(symbols, tickers):
+            price = last.get(ticker)
+            last_prices[sym] = float(price) if pd.notna(price) else None
         return last_prices 
\ No newline at end of file
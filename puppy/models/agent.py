@@ -36,10 +36,20 @@ class TradingAgent:
         Update agent's memory with new market data
         
         Args:
-            market_data: Dictionary containing date and market data
+            market_data: Dictionary containing date and either "data" records or a "frame" of them
         """
         self.memory.add_memory(market_data, "market_data")
         logger.debug("Memory updated with new market data")
+        
+    def update_memories(self, market_data: List[Dict[str, Any]]):
+        """
+        Update agent's memory with several days of market data in one batch
+        
+        Args:
+            market_data: List of dictionaries, each containing date and market data
+        """
+        self.memory.bulk_add(market_data, "market_data")
+        logger.debug(f"Memory updated with {len(market_data)} market data entries")
     
     def make_decisions(
         self,
@@ -52,7 +62,7 @@ class TradingAgent:
         Make trading decisions based on market data, portfolio state, and memory
         
         Args:
-            daily_data: DataFrame containing current market data
+            daily_data: DataFrame containing current market data, indexed by Symbol or by (Date, Symbol)
             portfolio_state: Current portfolio state
             current_date: Current trading date
             news: Optional list of news articles
@@ -60,64 +70,57 @@ class TradingAgent:
         Returns:
             Dictionary mapping symbols to trading actions
         """
-        # Get data for current date
+        # Get data for current date; symbol-indexed frames already hold only that date
         try:
-            current_data = daily_data.xs(current_date, level="Date")
+            current_data = daily_data.xs(current_date, level="Date") if isinstance(daily_data.index, pd.MultiIndex) else daily_data
         except KeyError:
             logger.warning(f"No data available for date {current_date}")
             return {}
             
-        # Convert current data to dict format
+        # Convert current data to dict format for the trader; callers record the day in memory themselves
         market_data = {
             "date": current_date,
             "data": []
         }
         
+        # Symbols are unique by construction; keep the first row should a feed ever repeat one
+        current_data = current_data[~current_data.index.duplicated()]
+        current_data = current_data.fillna({"RSI": 50.0})
+        
+        # Market trend from the first symbol's moving averages, read straight off the frame
+        market_trend = "neutral"
+        if not current_data.empty:
+            ma_20 = current_data["20d_MA"].iloc[0]
+            ma_50 = current_data["50d_MA"].iloc[0]
+            if pd.notna(ma_20) and pd.notna(ma_50):
+                market_trend = "bullish" if ma_20 > ma_50 else "bearish"
+        
+        def optional(x):
+            return float(x) if pd.notna(x) else None
+        
         # Process each symbol's data
-        for symbol in current_data.index:
+        for symbol, row in zip(current_data.index, current_data.to_dict(orient="records")):
             # Skip if we haven't held the position for minimum days
             if symbol in self.last_trade_date:
                 days_since_trade = (current_date - self.last_trade_date[symbol]).days
                 if days_since_trade < self.min_hold_days:
                     continue
-                    
-            row = current_data.loc[symbol]
-            current_price = float(row["Close"])
             
-            # Handle both Series and scalar values
-            def get_value(x):
-                if isinstance(x, pd.Series):
-                    return float(x.iloc[0])
-                return float(x)
-                
-            def is_valid(x):
-                if isinstance(x, pd.Series):
-                    return not x.isna().iloc[0]
-                return pd.notna(x)
-                
-            # Convert Series to scalar values
             market_data["data"].append({
                 "Symbol": symbol,
-                "Open": get_value(row["Open"]),
-                "High": get_value(row["High"]),
-                "Low": get_value(row["Low"]),
-                "Close": current_price,
-                "Volume": get_value(row["Volume"]),
-                "Daily_Return": (current_price - get_value(row["Close"])) / get_value(row["Close"]),
-                "RSI": get_value(row["RSI"]) if is_valid(row["RSI"]) else 50.0,
-                "20d_MA": get_value(row["20d_MA"]) if is_valid(row["20d_MA"]) else None,
-                "50d_MA": get_value(row["50d_MA"]) if is_valid(row["50d_MA"]) else None,
-                "Volume_MA": get_value(row["Volume_MA"]) if is_valid(row["Volume_MA"]) else None
+                "Open": float(row["Open"]),
+                "High": float(row["High"]),
+                "Low": float(row["Low"]),
+                "Close": float(row["Close"]),
+                "Volume": float(row["Volume"]),
+                "Daily_Return": optional(row.get("Daily_Return")) or 0.0,
+                "RSI": float(row["RSI"]),
+                "20d_MA": optional(row["20d_MA"]),
+                "50d_MA": optional(row["50d_MA"]),
+                "Volume_MA": optional(row["Volume_MA"])
             })
             
-        # Update memory
-        self.update_memory(market_data)
-        
         # Get relevant memories
-        market_trend = "neutral"
-        if market_data['data'] and market_data['data'][0]['20d_MA'] is not None and market_data['data'][0]['50d_MA'] is not None:
-            market_trend = 'bullish' if market_data['data'][0]['20d_MA'] > market_data['data'][0]['50d_MA'] else 'bearish'
-            
         query = f"What are the relevant market patterns and events for current conditions? Market trend is {market_trend}"
         relevant_memories = self.memory.retrieve_relevant_memories(query)
         
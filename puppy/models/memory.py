@@ -16,15 +16,20 @@ class LayeredMemory:
         
     def add_memory(self, data: Dict[str, Any], memory_type: str):
         """Add new memory entry"""
+        self.bulk_add([data], memory_type)
+        
+    def bulk_add(self, items: List[Dict[str, Any]], memory_type: str):
+        """Add several memory entries, re-sorting and trimming once for the whole batch"""
         try:
-            entry = self._create_memory_entry(data, memory_type)
-            
-            # Add to short-term memory
-            self.short_term.append(entry)
-            
-            # Check if it should be added to long-term memory
-            if entry["importance_score"] >= self.relevance_threshold:
-                self.long_term.append(entry)
+            for data in items:
+                entry = self._create_memory_entry(data, memory_type)
+                
+                # Add to short-term memory
+                self.short_term.append(entry)
+                
+                # Check if it should be added to long-term memory
+                if entry["importance_score"] >= self.relevance_threshold:
+                    self.long_term.append(entry)
                 
             # Maintain memory size limits
             self._maintain_memory_size()
@@ -45,8 +50,20 @@ class LayeredMemory:
         """Calculate importance score for memory entry"""
         importance = 0.0
         
+        # Check for market data kept as a frame, scoring every symbol at once. Backtest
+        # memories only feed this score; nothing reads their rows back as dicts
+        if "frame" in data:
+            frame = data["frame"]
+            volume_ma = frame["Volume_MA"]
+            ma_20 = frame["20d_MA"]
+            ma_50 = frame["50d_MA"]
+            importance += 0.3 * int((frame["Volume"] > volume_ma * 1.5).sum())  # Volume spike
+            importance += 0.2 * int((frame["Daily_Return"].abs() > 0.05).sum())  # 5% move
+            importance += 0.2 * int(((frame["RSI"] < 30) | (frame["RSI"] > 70)).sum())  # Extreme RSI
+            importance += 0.3 * int((ma_20.notna() & ma_50.notna() & (ma_20 != ma_50)).sum())  # MA crossover
+        
         # Check for market data
-        if "data" in data:
+        elif "data" in data:
             for stock_data in data["data"]:
                 # Volume spike
                 volume = stock_data.get("Volume", 0)
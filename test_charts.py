@@ -0,0 +1,39 @@
+import numpy as np
+import pandas as pd
+from app.utils.charts import lttb_indices, chart_points, _MAX_CHART_POINTS
+
+def test_lttb_keeps_short_series():
+    # Nothing to drop when the series already fits
+    x = np.arange(10, dtype=np.float64)
+    assert lttb_indices(x, x, 20).tolist() == list(range(10))
+    assert lttb_indices(x, x, 2).tolist() == list(range(10))
+
+def test_lttb_keeps_endpoints_in_order():
+    rng = np.random.default_rng(0)
+    x = np.arange(1000, dtype=np.float64)
+    y = rng.standard_normal(1000).cumsum()
+    
+    keep = lttb_indices(x, y, 100)
+    
+    assert len(keep) == 100
+    assert keep[0] == 0 and keep[-1] == 999
+    assert (np.diff(keep) > 0).all()
+
+def test_lttb_keeps_spike():
+    # A lone spike forms the largest triangle in its bucket
+    x = np.arange(1000, dtype=np.float64)
+    y = np.zeros(1000)
+    y[517] = 100.0
+    
+    assert 517 in lttb_indices(x, y, 50)
+
+def test_chart_points_downsamples_long_frames():
+    short = pd.DataFrame({'date': pd.date_range('2024-01-01', periods=10, freq='min'), 'value': range(10)})
+    assert chart_points(short, 'date', 'value') is short
+    
+    n = _MAX_CHART_POINTS * 4
+    long = pd.DataFrame({'date': pd.date_range('2024-01-01', periods=n, freq='min'), 'value': np.sin(np.arange(n) / 50)})
+    points = chart_points(long, 'date', 'value')
+    assert len(points) == _MAX_CHART_POINTS
+    assert points['date'].iloc[0] == long['date'].iloc[0]
+    assert points['date'].iloc[-1] == long['date'].iloc[-1]
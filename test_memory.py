@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+from puppy.models.memory import LayeredMemory
+
+def make_memory():
+    return LayeredMemory({"memory": {"short_term_capacity": 10, "long_term_capacity": 10, "relevance_threshold": 0.5}})
+
+def make_frame():
+    return pd.DataFrame({
+        "Symbol": ["TCS", "INFY", "ITC"],
+        "Open": [1.0, 1.0, 1.0],
+        "High": [1.0, 1.0, 1.0],
+        "Low": [1.0, 1.0, 1.0],
+        "Close": [1.0, 1.0, 1.0],
+        "Volume": [400.0, 100.0, 100.0],
+        "Daily_Return": [0.0, 0.0, 0.0],
+        "RSI": [50.0, 50.0, 50.0],
+        "20d_MA": [10.0, np.nan, 10.0],
+        "50d_MA": [10.0, 10.0, 10.0],
+        "Volume_MA": [100.0, np.nan, 100.0]
+    })
+
+def test_frame_scores_like_records():
+    memory = make_memory()
+    frame = make_frame()
+    # The same rows as per-symbol dicts, missing values as None
+    records = frame.astype(object).where(frame.notna(), None).to_dict(orient="records")
+    
+    score = memory._calculate_importance({"date": "2024-01-01", "frame": frame})
+    
+    assert score == memory._calculate_importance({"date": "2024-01-01", "data": records})
+    assert score == 0.3  # Only TCS has a volume spike; equal or missing averages aren't crossovers
+
+def test_frame_score_is_capped():
+    frame = make_frame()
+    frame["RSI"] = 80.0
+    frame["Daily_Return"] = 0.1
+    
+    assert make_memory()._calculate_importance({"frame": frame}) == 1.0
+
+def test_bulk_add_trims_once():
+    memory = make_memory()
+    quiet = make_frame()
+    quiet["Volume"] = 100.0
+    busy = make_frame()
+    busy["RSI"] = 80.0
+    
+    memory.bulk_add([{"date": i, "frame": quiet} for i in range(12)] + [{"date": 12, "frame": busy}], "market_data")
+    
+    assert len(memory.short_term) == 10
+    assert memory.short_term[0]["data"]["date"] == 12
+    assert [m["data"]["date"] for m in memory.long_term] == [12]
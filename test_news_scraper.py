@@ -0,0 +1,127 @@
+import asyncio
+from contextlib import asynccontextmanager
+import aiohttp
+import pytest
+from app.utils.news_scraper import RequestLimiter, CircuitOpen, _fetch_page
+
+URL = "https://news.example.com/markets"
+
+async def fail(limiter):
+    with pytest.raises(aiohttp.ClientError):
+        async with limiter.limit(URL):
+            raise aiohttp.ClientConnectionError("connection refused")
+
+async def succeed(limiter):
+    async with limiter.limit(URL):
+        pass
+
+class FakeResponse:
+    charset = "utf-8"
+    
+    async def read(self):
+        return b"<html></html>"
+
+class FakeSession:
+    """Fails the first `failures` GETs with the given error, then serves a page"""
+    def __init__(self, failures, error):
+        self.failures = failures
+        self.error = error
+        self.calls = 0
+    
+    @asynccontextmanager
+    async def get(self, url, **kwargs):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error
+        yield FakeResponse()
+
+def test_circuit_opens_after_max_failures():
+    async def run():
+        limiter = RequestLimiter(max_failures=2, cooldown=60)
+        await fail(limiter)
+        await succeed(limiter)  # A success resets the count
+        await fail(limiter)
+        await fail(limiter)
+        
+        with pytest.raises(CircuitOpen):
+            await succeed(limiter)
+        
+        # Other hosts are unaffected
+        async with limiter.limit("https://other.example.com/"):
+            pass
+    
+    asyncio.run(run())
+
+def test_half_open_allows_one_trial():
+    async def run():
+        limiter = RequestLimiter(max_failures=1, cooldown=0.01)
+        await fail(limiter)
+        await asyncio.sleep(0.02)
+        
+        # The trial is in flight; everything else is still turned away
+        release = asyncio.Event()
+        async def trial():
+            async with limiter.limit(URL):
+                await release.wait()
+        task = asyncio.create_task(trial())
+        await asyncio.sleep(0)
+        with pytest.raises(CircuitOpen):
+            await succeed(limiter)
+        
+        # A successful trial closes the circuit
+        release.set()
+        await task
+        await succeed(limiter)
+        await succeed(limiter)
+    
+    asyncio.run(run())
+
+def test_failed_trial_reopens_circuit():
+    async def run():
+        limiter = RequestLimiter(max_failures=3, cooldown=0.01)
+        for _ in range(3):
+            await fail(limiter)
+        await asyncio.sleep(0.02)
+        
+        # One failed trial is enough to reopen, and a new cooldown starts
+        await fail(limiter)
+        with pytest.raises(CircuitOpen):
+            await succeed(limiter)
+        await asyncio.sleep(0.02)
+        await succeed(limiter)
+    
+    asyncio.run(run())
+
+def test_fetch_retries_timeouts(monkeypatch):
+    monkeypatch.setattr(asyncio, "sleep", lambda delay: asyncio.gather())  # Skip the backoff
+    
+    async def run():
+        limiter = RequestLimiter(max_failures=1)
+        session = FakeSession(1, asyncio.TimeoutError())
+        
+        # A timeout is retried like a client error, and a fetch that recovers counts as a success
+        assert await _fetch_page(session, limiter, URL) == (b"<html></html>", "utf-8")
+        assert session.calls == 2
+        await succeed(limiter)
+    
+    asyncio.run(run())
+
+def test_failed_fetch_counts_once(monkeypatch):
+    monkeypatch.setattr(asyncio, "sleep", lambda delay: asyncio.gather())
+    
+    async def run():
+        limiter = RequestLimiter(max_failures=2)
+        
+        # Both attempts of one fetch fail, but the breaker sees one failure
+        with pytest.raises(aiohttp.ClientError):
+            await _fetch_page(FakeSession(2, aiohttp.ClientConnectionError()), limiter, URL)
+        await _fetch_page(FakeSession(0, None), limiter, URL)
+        
+        # Two failed fetches in a row open the circuit
+        for _ in range(2):
+            with pytest.raises(aiohttp.ClientError):
+                await _fetch_page(FakeSession(2, aiohttp.ClientConnectionError()), limiter, URL)
+        with pytest.raises(CircuitOpen):
+            await _fetch_page(FakeSession(0, None), limiter, URL)
+    
+    asyncio.run(run())
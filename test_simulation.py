@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+from puppy.core.simulation import _prepare_panel, MEMORY_COLUMNS
+
+def make_panel():
+    dates = pd.date_range("2024-01-01", periods=3)
+    closes = {"TCS": [100.0, 110.0, 99.0], "INFY": [50.0, 25.0, 50.0]}
+    rows = []
+    for symbol, prices in closes.items():
+        for date, close in zip(dates, prices):
+            rows.append({"Date": date, "Symbol": symbol, "Close": close})
+    panel = pd.DataFrame(rows)
+    for column in MEMORY_COLUMNS:
+        if column not in panel:
+            panel[column] = np.nan
+    # Loaded panels are grouped by symbol, not by date
+    return panel.set_index(["Date", "Symbol"])
+
+def test_daily_return_is_per_symbol():
+    panel = _prepare_panel(make_panel())
+    
+    # Each symbol's return only looks at its own previous close; first days have none and read 0
+    returns = panel["Daily_Return"].unstack("Symbol")
+    np.testing.assert_allclose(returns["TCS"], [0.0, 0.1, -0.1])
+    np.testing.assert_allclose(returns["INFY"], [0.0, -0.5, 1.0])
+
+def test_panel_is_sorted_and_filled():
+    panel = _prepare_panel(make_panel())
+    
+    assert panel.index.is_monotonic_increasing
+    assert (panel["RSI"] == 50.0).all()
+    assert (panel[MEMORY_COLUMNS].dtypes == np.float64).all()
+    # Averages stay missing until a memory materializes them
+    assert panel["20d_MA"].isna().all()
@@ -0,0 +1,101 @@
+import gc
+import threading
+import weakref
+import numpy as np
+import pytest
+from app.utils.trading import TradingSimulator, SimulatorPool, _step_prices
+
+def make_config(tmp_path, name="state.json"):
+    return {
+        'user': 'tester',
+        'initial_capital': 100000,
+        'risk_profile': 'Balanced',
+        'state_file': str(tmp_path / name)
+    }
+
+def test_step_prices_moves_in_place():
+    prices = np.array([100.0, 200.0, 300.0])
+    vols = np.array([0.01, 0.02, 0.0])
+    noise = np.empty_like(prices)
+    
+    # Same seed, same draw: every price moves by its own volatility-scaled normal
+    expected = prices * (1.0 + vols * np.random.default_rng(7).standard_normal(3))
+    _step_prices(np.random.default_rng(7), prices, vols, noise)
+    
+    np.testing.assert_allclose(prices, expected)
+    assert prices[2] == 300.0  # Zero volatility never moves
+
+def test_transactions_round_trip_through_columns(tmp_path):
+    sim = TradingSimulator(make_config(tmp_path))
+    sim._record_transaction("2024-01-01 10:00:00", "TCS", "BUY", 10, 3500.0, 0.0)
+    sim._record_transaction("2024-01-01 10:05:00", "TCS", "SELL", 4, 3600.0, 400.0)
+    
+    assert sim.transaction_count == 2
+    assert sim.transactions == [
+        {'timestamp': "2024-01-01 10:00:00", 'symbol': "TCS", 'action': "BUY", 'quantity': 10,
+         'price': 3500.0, 'value': 35000.0, 'profit_loss': 0.0},
+        {'timestamp': "2024-01-01 10:05:00", 'symbol': "TCS", 'action': "SELL", 'quantity': 4,
+         'price': 3600.0, 'value': 14400.0, 'profit_loss': 400.0}
+    ]
+    
+    # The state only reports the count; the list is written with the persisted state
+    state = sim.get_state()
+    assert 'transactions' not in state and state['transaction_count'] == 2
+    sim._dirty = True
+    sim.close()
+    
+    reloaded = TradingSimulator(make_config(tmp_path))
+    assert reloaded.transactions == sim.transactions
+
+def test_transactions_keep_latest_max(tmp_path):
+    sim = TradingSimulator(make_config(tmp_path))
+    sim.max_transactions = 50
+    for i in range(200):
+        sim._record_transaction(str(i), "INFY", "BUY", 1, float(i), 0.0)
+    
+    assert sim.transaction_count == 200
+    assert [t['timestamp'] for t in sim.transactions] == [str(i) for i in range(150, 200)]
+    
+    # Appended rows can be pulled by offset; offsets older than what is kept start at the oldest row
+    assert [t['timestamp'] for t in sim.transactions_since(197)] == ["197", "198", "199"]
+    assert sim.transactions_since(200) == []
+    assert len(sim.transactions_since(0)) == 50
+    
+    sim.reset_capital(50000)
+    assert sim.transaction_count == 0 and sim.transactions == []
+    sim.close()
+
+def test_close_stops_writer(tmp_path):
+    threads = threading.active_count()
+    sim = TradingSimulator(make_config(tmp_path))
+    sim.reset_capital(50000)  # Forces a save, starting the writer
+    assert threading.active_count() == threads + 1
+    
+    sim.close()
+    assert threading.active_count() == threads
+    assert (tmp_path / "state.json").exists()
+    
+    # Without a running writer nothing keeps the simulator alive
+    ref = weakref.ref(sim)
+    del sim
+    gc.collect()
+    assert ref() is None
+
+def test_pool_members_get_own_state_files(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config = make_config(tmp_path)
+    del config['state_file']
+    
+    pool = SimulatorPool([config, config])
+    assert [str(sim.state_file) for sim in pool.simulators] == ["data/trading_state_0.json", "data/trading_state_1.json"]
+    
+    # Members price off their row of the shared matrix
+    before = pool._prices.copy()
+    pool.update()
+    assert not np.array_equal(before, pool._prices)
+    for row, sim in enumerate(pool.simulators):
+        assert sim.stock_prices == dict(zip(sim.nifty50_symbols, pool._prices[row].tolist()))
+    pool.flush()
+    
+    with pytest.raises(ValueError):
+        SimulatorPool([make_config(tmp_path), make_config(tmp_path)])